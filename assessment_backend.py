@@ -17,11 +17,15 @@ Author: Joe (Simply Works AI)
 For: Blistex Inc - Maintenance Assessment Tool
 """
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from flask import Flask, request, jsonify, make_response
 from datetime import datetime
+from functools import lru_cache, wraps
+import atexit
 import json
 import os
+import sys
+import threading
+import uuid
 
 # Import our AVL-based tracker
 from candidate_score_tracker import CandidateScoreTracker
@@ -34,73 +38,255 @@ app = Flask(__name__)
 
 # Enable CORS so React app can call this API
 # React runs on localhost:3000, this server on localhost:5000
-CORS(app, origins=["http://localhost:3000", "http://127.0.0.1:3000"])
+# With a fixed two-origin allowlist a set lookup and a few headers do the
+# job, so there is no need for flask-cors' per-request matching.
+ALLOWED_ORIGINS = frozenset(["http://localhost:3000", "http://127.0.0.1:3000"])
+
+
+@app.before_request
+def _cors_preflight():
+    """Answer CORS preflight requests without dispatching to a view."""
+    if request.method == 'OPTIONS':
+        return app.response_class(status=204)
+
+
+@app.after_request
+def _cors_headers(response):
+    """Allow the React origins to read responses and send JSON bodies."""
+    origin = request.headers.get('Origin')
+    if origin in ALLOWED_ORIGINS:
+        headers = response.headers
+        headers['Access-Control-Allow-Origin'] = origin
+        response.vary.add('Origin')
+        if request.method == 'OPTIONS':
+            headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+            headers['Access-Control-Allow-Headers'] = request.headers.get(
+                'Access-Control-Request-Headers', 'Content-Type'
+            )
+    return response
+
+
+# Skip the per-response key sort in Flask's JSON provider; clients read
+# fields by name, so ordering buys nothing on the hot GET endpoints
+app.json.sort_keys = False
 
 # Initialize the score tracker
 tracker = CandidateScoreTracker(passing_threshold=70.0, max_candidates=10000)
 
-# Data file for persistence
+# Bumped whenever load_data() swaps in a new tracker (see versioned)
+_tracker_generation = 0
+
+# Random per-process token: generation and version restart from the same
+# numbers on every boot, so ETags also name the process that issued them
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+# Data file for persistence (full snapshot)
 DATA_FILE = "assessment_scores.json"
 
+# Append-only log of submissions made since the last snapshot. One JSON
+# record per line; replayed on top of DATA_FILE at startup.
+LOG_FILE = "assessment_scores.log"
+
+# Rewrite the snapshot (and truncate the log) after this many appends
+COMPACT_EVERY = 1000
+
+# Number of records currently sitting in LOG_FILE
+_log_appends = 0
+
+# The dev server (and any threaded WSGI server) handles requests on
+# several threads. Tracker mutations and the log/snapshot files they feed
+# must not interleave, so writers serialize on this lock.
+_write_lock = threading.Lock()
+
+
+# =============================================================================
+# DOMAIN NORMALIZATION
+# =============================================================================
+
+# Display names sent by the React app -> tracker domain keys. Built once at
+# import instead of per request. The values are identifier-like literals,
+# which CPython interns, so tracker dict lookups on them compare by identity.
+DOMAIN_MAPPING = {
+    "Mechanical Systems": "mechanical",
+    "Electrical Systems": "electrical",
+    "Hydraulics & Pneumatics": "hydraulics",
+    "PLC & Automation": "plcs",
+    "Safety & Compliance": "safety",
+    "Troubleshooting": "troubleshooting"
+}
+
+
+def normalize_domain(domain):
+    """Map a display/domain name to the tracker's domain key."""
+    mapped = DOMAIN_MAPPING.get(domain)
+    if mapped is not None:
+        return mapped
+    # Already normalized or unknown - use as-is
+    return sys.intern(domain.lower().replace(" ", "_"))
+
+
+# =============================================================================
+# REQUEST VALIDATION
+# =============================================================================
+
+SUBMIT_FIELDS = ('candidate_id', 'name', 'overall_score', 'domain_scores')
+
+
+def parse_submission(data):
+    """
+    Validate and coerce an /api/submit body in a single pass.
+    
+    Everything is checked before the tracker is touched, so a bad score
+    can no longer remove an existing candidate and then fail to re-add it.
+    
+    Returns:
+        Tuple of (candidate_id, name, overall_score, domain_scores) with
+        ids/names as strings, scores as floats, and domains normalized.
+    
+    Raises:
+        ValueError: With a message suitable for the 400 response.
+    """
+    missing = [f for f in SUBMIT_FIELDS if f not in data]
+    if missing:
+        raise ValueError(f"Missing fields: {missing}")
+    
+    domain_scores = data['domain_scores']
+    if not isinstance(domain_scores, dict):
+        raise ValueError("domain_scores must be an object")
+    
+    try:
+        overall_score = float(data['overall_score'])
+        normalized_scores = {
+            normalize_domain(domain): float(score)
+            for domain, score in domain_scores.items()
+        }
+    except (TypeError, ValueError):
+        raise ValueError("Scores must be numeric")
+    
+    return str(data['candidate_id']), str(data['name']), overall_score, normalized_scores
+
 
 # =============================================================================
 # DATA PERSISTENCE
 # =============================================================================
 
+def _candidate_record(candidate):
+    """Build the JSON-serializable record stored for a candidate."""
+    return {
+        "candidate_id": candidate.candidate_id,
+        "name": candidate.name,
+        "score": candidate.score,
+        "domain_scores": candidate.domain_scores,
+        "timestamp": candidate.timestamp_iso,
+        "passed": candidate.passed
+    }
+
+
 def save_data():
-    """Save tracker data to JSON file."""
+    """
+    Save a full snapshot of tracker data to JSON file.
+    
+    This is the compaction step: once the snapshot is on disk the
+    append log is redundant and gets truncated.
+    """
+    global _log_appends
+    
     data = {
         "saved_at": datetime.now().isoformat(),
         "passing_threshold": tracker.passing_threshold,
-        "candidates": []
+        "candidates": [_candidate_record(c) for c in tracker._candidates.values()]
     }
     
-    for cid, candidate in tracker._candidates.items():
-        data["candidates"].append({
-            "candidate_id": candidate.candidate_id,
-            "name": candidate.name,
-            "score": candidate.score,
-            "domain_scores": candidate.domain_scores,
-            "timestamp": candidate.timestamp.isoformat(),
-            "passed": candidate.passed
-        })
+    # Compact separators: no indent/whitespace keeps the encoder on its
+    # fast path and roughly halves the bytes written per save.
+    # Write to a temp file and swap it in so a crash mid-write never
+    # leaves a truncated snapshot behind.
+    tmp_file = DATA_FILE + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_file, DATA_FILE)
     
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    if os.path.exists(LOG_FILE):
+        os.remove(LOG_FILE)
+    _log_appends = 0
     
     return len(data["candidates"])
 
 
+def append_candidate(candidate):
+    """
+    Persist a single new/updated candidate by appending it to the log.
+    
+    O(1) per submit instead of rewriting every candidate; the snapshot
+    is rebuilt every COMPACT_EVERY appends and on shutdown.
+    """
+    global _log_appends
+    
+    line = json.dumps(_candidate_record(candidate), separators=(',', ':'))
+    with open(LOG_FILE, 'a') as f:
+        f.write(line + "\n")
+    
+    _log_appends += 1
+    if _log_appends >= COMPACT_EVERY:
+        save_data()
+
+
+@atexit.register
+def _compact_on_exit():
+    """Fold any pending log records into the snapshot on shutdown."""
+    with _write_lock:
+        if _log_appends:
+            save_data()
+
+
 def load_data():
-    """Load tracker data from JSON file."""
-    global tracker
+    """Load tracker data from the JSON snapshot, then replay the log."""
+    global tracker, _log_appends, _tracker_generation
     
-    if not os.path.exists(DATA_FILE):
+    if not os.path.exists(DATA_FILE) and not os.path.exists(LOG_FILE):
         print("No existing data file found. Starting fresh.")
         return 0
     
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
+        data = {}
+        if os.path.exists(DATA_FILE):
+            with open(DATA_FILE, 'r') as f:
+                data = json.load(f)
         
-        # Recreate tracker
+        # Recreate tracker (its version restarts, so drop cached results)
         threshold = data.get("passing_threshold", 70.0)
         tracker = CandidateScoreTracker(passing_threshold=threshold)
+        _tracker_generation += 1
+        _clear_caches()
         
-        # Add all candidates
-        count = 0
+        # Collect all candidates first (skipping duplicate IDs, first one
+        # wins) so the trees are built in one bulk load instead of N inserts
+        records = {}
         for c in data.get("candidates", []):
-            try:
-                tracker.add_candidate(
-                    candidate_id=c["candidate_id"],
-                    name=c["name"],
-                    overall_score=c["score"],
-                    domain_scores=c["domain_scores"]
-                )
-                count += 1
-            except ValueError:
-                pass  # Skip duplicates
+            records.setdefault(c["candidate_id"], (
+                c["candidate_id"], c["name"], c["score"], c["domain_scores"]
+            ))
+        
+        # Replay submissions logged after the snapshot. Later records win,
+        # matching the update-in-place behaviour of /api/submit.
+        _log_appends = 0
+        if os.path.exists(LOG_FILE):
+            with open(LOG_FILE, 'r') as f:
+                for line in f:
+                    try:
+                        c = json.loads(line)
+                    except ValueError:
+                        continue  # Torn final line from an interrupted write
+                    records.pop(c["candidate_id"], None)
+                    records[c["candidate_id"]] = (
+                        c["candidate_id"], c["name"], c["score"],
+                        c["domain_scores"]
+                    )
+                    _log_appends += 1
         
+        tracker.bulk_add(records.values())
+        
+        count = tracker.total_candidates
         print(f"Loaded {count} candidates from {DATA_FILE}")
         return count
     
@@ -109,6 +295,65 @@ def load_data():
         return 0
 
 
+# =============================================================================
+# RESULT CACHES
+# =============================================================================
+# Rank, percentile, and the aggregate endpoints only change when the
+# tracker does, so memoize them keyed on the tracker version. Repeat reads
+# between submits are O(1).
+
+@lru_cache(maxsize=4096)
+def _cached_rank(candidate_id, version):
+    return tracker.get_rank(candidate_id)
+
+
+@lru_cache(maxsize=4096)
+def _cached_percentile(score, version):
+    return tracker.get_percentile(score)
+
+
+def _clear_caches():
+    """Drop every version-keyed cache (call when the tracker is replaced)."""
+    _cached_rank.cache_clear()
+    _cached_percentile.cache_clear()
+    _statistics_body.cache_clear()
+    _domain_analysis_body.cache_clear()
+
+
+def get_rank(candidate_id):
+    """Get a candidate's rank, cached per tracker version."""
+    return _cached_rank(candidate_id, tracker.version)
+
+
+def get_percentile_for(score):
+    """Get the percentile for a score, cached per tracker version."""
+    return _cached_percentile(score, tracker.version)
+
+
+def versioned(view):
+    """
+    Tag a read-only endpoint's response with an ETag for the tracker state.
+    
+    A client polling with If-None-Match gets a bodyless 304 while nothing
+    has changed, without the view running at all. The tag includes the
+    load generation because the version restarts when load_data()
+    replaces the tracker, and a boot token so a tag from before a
+    restart never matches the reloaded data.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = f"{_BOOT_ID}-{_tracker_generation}-{tracker.version}"
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag)
+        return response
+    return wrapper
+
+
 # =============================================================================
 # API ROUTES
 # =============================================================================
@@ -140,54 +385,37 @@ def submit_score():
         }
     }
     """
-    data = request.get_json()
+    # The body is read once, so don't keep a parsed copy on the request
+    data = request.get_json(cache=False)
     
     if not data:
         return jsonify({"error": "No JSON data provided"}), 400
     
-    required = ['candidate_id', 'name', 'overall_score', 'domain_scores']
-    missing = [f for f in required if f not in data]
-    if missing:
-        return jsonify({"error": f"Missing fields: {missing}"}), 400
-    
-    # Normalize domain names to match our tracker
-    domain_mapping = {
-        "Mechanical Systems": "mechanical",
-        "Electrical Systems": "electrical", 
-        "Hydraulics & Pneumatics": "hydraulics",
-        "PLC & Automation": "plcs",
-        "Safety & Compliance": "safety",
-        "Troubleshooting": "troubleshooting"
-    }
-    
-    normalized_scores = {}
-    for domain, score in data['domain_scores'].items():
-        # Handle both formats
-        if domain in domain_mapping:
-            normalized_scores[domain_mapping[domain]] = score
-        else:
-            # Already normalized or unknown - use as-is
-            normalized_scores[domain.lower().replace(" ", "_")] = score
+    try:
+        candidate_id, name, overall_score, domain_scores = parse_submission(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     try:
-        # Check if candidate already exists (update instead of error)
-        existing = tracker.get_candidate(data['candidate_id'])
-        if existing:
-            tracker.remove_candidate(data['candidate_id'])
-        
-        candidate = tracker.add_candidate(
-            candidate_id=data['candidate_id'],
-            name=data['name'],
-            overall_score=float(data['overall_score']),
-            domain_scores=normalized_scores
-        )
-        
-        # Save to file
-        save_data()
-        
-        # Get ranking info
-        rank = tracker.get_rank(data['candidate_id'])
-        percentile = tracker.get_percentile(candidate.score)
+        with _write_lock:
+            # Check if candidate already exists (update instead of error)
+            existing = tracker.get_candidate(candidate_id)
+            if existing:
+                tracker.remove_candidate(candidate_id)
+            
+            candidate = tracker.add_candidate(
+                candidate_id=candidate_id,
+                name=name,
+                overall_score=overall_score,
+                domain_scores=domain_scores
+            )
+            
+            # Persist just this candidate
+            append_candidate(candidate)
+            
+            # Get ranking info for the state this submit produced
+            rank = get_rank(candidate_id)
+            percentile = get_percentile_for(candidate.score)
         
         return jsonify({
             "success": True,
@@ -207,7 +435,70 @@ def submit_score():
         return jsonify({"error": str(e)}), 400
 
 
+@app.route('/api/submit-batch', methods=['POST'])
+def submit_batch():
+    """
+    Submit many completed assessments at once (e.g. a backfill).
+    
+    Expected JSON body:
+    {
+        "candidates": [
+            {"candidate_id": "C001", "name": ..., "overall_score": ..., "domain_scores": {...}},
+            ...
+        ]
+    }
+    
+    Existing candidates are updated in place, as with /api/submit. The
+    whole batch is validated first and persisted with a single snapshot
+    write instead of one log append per candidate.
+    """
+    data = request.get_json(cache=False)
+    
+    if not isinstance(data, dict) or not isinstance(data.get('candidates'), list):
+        return jsonify({"error": "Expected a JSON object with a 'candidates' list"}), 400
+    
+    # Validate everything up front; later entries for an ID win
+    records = {}
+    for i, entry in enumerate(data['candidates']):
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("Expected an object")
+            record = parse_submission(entry)
+        except ValueError as e:
+            return jsonify({"error": f"candidates[{i}]: {e}"}), 400
+        records[record[0]] = record
+    
+    try:
+        with _write_lock:
+            # Check capacity before removing the candidates being updated,
+            # so a rejected batch leaves the tracker untouched
+            replaced = [cid for cid in records if tracker.get_candidate(cid)]
+            new_total = tracker.total_candidates - len(replaced) + len(records)
+            if new_total > tracker.max_candidates:
+                raise ValueError(
+                    f"Batch would exceed max_candidates ({tracker.max_candidates})"
+                )
+            
+            for candidate_id in replaced:
+                tracker.remove_candidate(candidate_id)
+            
+            added = tracker.bulk_add(records.values())
+            
+            # One full snapshot replaces N log appends
+            save_data()
+        
+        return jsonify({
+            "success": True,
+            "submitted": len(added),
+            "total_candidates": tracker.total_candidates
+        }), 201
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+
 @app.route('/api/candidate/<candidate_id>', methods=['GET'])
+@versioned
 def get_candidate(candidate_id):
     """Get a specific candidate's details and ranking."""
     candidate = tracker.get_candidate(candidate_id)
@@ -215,8 +506,8 @@ def get_candidate(candidate_id):
     if not candidate:
         return jsonify({"error": f"Candidate {candidate_id} not found"}), 404
     
-    rank = tracker.get_rank(candidate_id)
-    percentile = tracker.get_percentile(candidate.score)
+    rank = get_rank(candidate_id)
+    percentile = get_percentile_for(candidate.score)
     
     return jsonify({
         "candidate": {
@@ -228,14 +519,25 @@ def get_candidate(candidate_id):
             "total_candidates": tracker.total_candidates,
             "percentile": round(percentile, 1),
             "domain_scores": {k: round(v, 1) for k, v in candidate.domain_scores.items()},
-            "timestamp": candidate.timestamp.isoformat()
+            "timestamp": candidate.timestamp_iso
         }
     })
 
 
 @app.route('/api/rankings', methods=['GET'])
+@versioned
 def get_rankings():
-    """Get ranked list of candidates."""
+    """
+    Get ranked list of candidates.
+    
+    Each row carries rank, candidate_id, name, score, percentile and
+    passed; score and percentile are rounded to one decimal, as in
+    /api/candidate.
+    
+    The body is streamed one ranking at a time rather than built as a
+    full list of dicts and encoded in one go, so large limits don't hold
+    the whole payload in memory and the client can start parsing early.
+    """
     limit = request.args.get('limit', 50, type=int)
     filter_type = request.args.get('filter', 'all')  # all, passed, failed
     
@@ -246,61 +548,100 @@ def get_rankings():
     else:
         candidates = tracker.get_top_candidates(limit)
     
-    rankings = []
-    for c in candidates:
-        rank = tracker.get_rank(c.candidate_id)
-        rankings.append({
-            "rank": rank,
-            "candidate_id": c.candidate_id,
-            "name": c.name,
-            "score": round(c.score, 1),
-            "passed": c.passed
-        })
+    # Resolve ranks now so the stream reflects the state at request time
+    if filter_type in ('passed', 'failed'):
+        ranks = [get_rank(c.candidate_id) for c in candidates]
+    else:
+        # Top-N is already in rank order
+        ranks = range(1, len(candidates) + 1)
     
-    return jsonify({
+    # One pass over the score array for every row's percentile
+    percentiles = tracker.get_percentiles(c.score for c in candidates)
+    
+    head = json.dumps({
         "total_candidates": tracker.total_candidates,
-        "filter": filter_type,
-        "rankings": rankings
-    })
+        "filter": filter_type
+    }, separators=(',', ':'))
+    
+    dumps = json.dumps
+    
+    def generate():
+        yield head[:-1] + ',"rankings":['
+        for i, (rank, percentile, c) in enumerate(zip(ranks, percentiles, candidates)):
+            # Rows are templated directly: only the strings need escaping,
+            # and '.1f' writes the one-decimal score and percentile as JSON
+            # numbers in a single format call instead of round() + repr().
+            row = (
+                f'{{"rank":{rank},'
+                f'"candidate_id":{dumps(c.candidate_id)},'
+                f'"name":{dumps(c.name)},'
+                f'"score":{c.score:.1f},'
+                f'"percentile":{percentile:.1f},'
+                f'"passed":{"true" if c.passed else "false"}}}'
+            )
+            yield row if i == 0 else "," + row
+        yield "]}"
+    
+    return app.response_class(generate(), mimetype='application/json')
 
 
 @app.route('/api/statistics', methods=['GET'])
+@versioned
 def get_statistics():
     """Get overall statistics."""
-    stats = tracker.get_statistics()
-    return jsonify(stats)
+    return app.response_class(
+        _statistics_body(tracker.version), mimetype='application/json'
+    )
+
+
+@lru_cache(maxsize=2)
+def _statistics_body(version):
+    """Encoded /api/statistics body, reused until the tracker changes."""
+    return json.dumps(tracker.get_statistics(), separators=(',', ':'))
 
 
 @app.route('/api/domain-analysis', methods=['GET'])
+@versioned
 def get_domain_analysis():
     """Get performance analysis by domain."""
-    analyses = {}
+    return app.response_class(
+        _domain_analysis_body(tracker.version), mimetype='application/json'
+    )
+
+
+@lru_cache(maxsize=2)
+def _domain_analysis_body(version):
+    """Encoded /api/domain-analysis body, reused until the tracker changes."""
+    # One analysis per domain, reused for weakest/strongest below
+    domain_analyses = tracker.get_domain_analyses()
     
-    for domain in tracker.DOMAINS:
-        analysis = tracker.get_domain_analysis(domain)
-        if analysis:
-            analyses[domain] = {
-                "average_score": round(analysis.average_score, 1),
-                "min_score": round(analysis.min_score, 1),
-                "max_score": round(analysis.max_score, 1),
-                "candidates_below_threshold": analysis.candidates_below_threshold,
-                "total_candidates": analysis.total_candidates
-            }
+    analyses = {}
+    for domain, analysis in domain_analyses.items():
+        analyses[domain] = {
+            "average_score": round(analysis.average_score, 1),
+            "min_score": round(analysis.min_score, 1),
+            "max_score": round(analysis.max_score, 1),
+            "candidates_below_threshold": analysis.candidates_below_threshold,
+            "total_candidates": analysis.total_candidates
+        }
     
-    weakest = tracker.get_weakest_domain()
-    strongest = tracker.get_strongest_domain()
+    weakest = strongest = None
+    if domain_analyses:
+        weakest = min(domain_analyses.values(), key=lambda a: a.average_score)
+        strongest = max(domain_analyses.values(), key=lambda a: a.average_score)
     
-    return jsonify({
+    return json.dumps({
         "domains": analyses,
-        "weakest_domain": weakest[0] if weakest else None,
-        "strongest_domain": strongest[0] if strongest else None
-    })
+        "weakest_domain": weakest.domain if weakest else None,
+        "strongest_domain": strongest.domain if strongest else None
+    }, separators=(',', ':'))
 
 
 @app.route('/api/percentile/<float:score>', methods=['GET'])
+@versioned
 def get_percentile(score):
     """Get percentile for a given score."""
-    percentile = tracker.get_percentile(score)
+    percentile = get_percentile_for(score)
     
     return jsonify({
         "score": score,
@@ -326,6 +667,7 @@ if __name__ == '__main__':
     print()
     print("API Endpoints:")
     print("  POST /api/submit          - Submit assessment score")
+    print("  POST /api/submit-batch    - Submit many scores at once")
     print("  GET  /api/candidate/<id>  - Get candidate details")
     print("  GET  /api/rankings        - Get ranked list")
     print("  GET  /api/statistics      - Get overall stats")
@@ -334,4 +676,7 @@ if __name__ == '__main__':
     print("Your React app can now send scores to this server!")
     print("=" * 60)
     
-    app.run(debug=True, port=5000)
+    # The reloader and interactive debugger add work to every request;
+    # opt in with FLASK_DEBUG=1 when developing
+    debug = os.getenv('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, port=5000, threaded=True, use_reloader=debug)
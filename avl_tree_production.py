@@ -10,7 +10,7 @@ Author: Joe (Simply Works AI)
 Version: 3.0 (Production)
 
 Security Features:
-    - Thread-safe operations using reentrant locks
+    - Thread-safe operations using a per-tree readers-writer lock
     - Maximum size limits to prevent memory exhaustion
     - Maximum depth limits to prevent stack overflow
     - Input validation for all public methods
@@ -27,15 +27,21 @@ Functional Features:
 # IMPORTS
 # =============================================================================
 
-import threading  # Provides Lock and RLock for thread synchronization.
-                  # threading.RLock (reentrant lock) allows the same thread
-                  # to acquire the lock multiple times without deadlocking.
+import threading  # Provides Lock and Condition for thread synchronization.
+                  # They are the building blocks of the readers-writer lock
+                  # defined below.
 
 import logging    # Python's built-in logging framework for recording events.
                   # We use this instead of print() for production-grade output
                   # that can be configured, filtered, and redirected.
 
-from typing import Optional, Any, List, Iterator, Callable
+import math       # log2() for the AVL height bound in _quick_validate.
+
+from contextlib import nullcontext
+                  # A context manager that does nothing; stands in for the
+                  # lock in trees created with thread_safe=False.
+
+from typing import Optional, Any, List, Iterator, Callable, Iterable
                   # Type hints for better code documentation and IDE support.
                   # Optional[X] means "X or None"
                   # Any means any type is acceptable
@@ -53,6 +59,24 @@ from typing import Optional, Any, List, Iterator, Callable
 # This allows fine-grained control over logging for just this module.
 logger = logging.getLogger(__name__)
 
+# Built-in key types whose values are always comparable with each other.
+# Keys of exactly these types skip the trial comparisons in _validate_key.
+# (type() is checked rather than isinstance() so that subclasses, which
+# may override the comparison operators, are still validated.)
+_TRUSTED_KEY_TYPES = frozenset({int, float, str, bytes})
+
+# Maximum number of deleted nodes each tree keeps for reuse (see
+# AVLTree._node_pool). Bounds the memory a tree holds on to after a burst
+# of deletions.
+_NODE_POOL_LIMIT = 1024
+
+# bulk_insert() rebuilds the whole tree when the batch is more than
+# 1/_BULK_REBUILD_RATIO of the tree's size, and inserts key by key
+# otherwise. A rebuild touches every node, while in-place inserts cost a
+# descent per new key; on a 100k-key tree the two break even at about a
+# quarter.
+_BULK_REBUILD_RATIO = 4
+
 
 # =============================================================================
 # CUSTOM EXCEPTIONS
@@ -109,6 +133,142 @@ class AVLTreeKeyError(AVLTreeError):
     pass
 
 
+# =============================================================================
+# READERS-WRITER LOCK
+# =============================================================================
+
+class _ReadWriteLock:
+    """
+    A readers-writer lock: many readers at once, OR one writer alone.
+    
+    A plain Lock serializes everything, including threads that only look
+    at the tree (search, 'in', len, iteration). Readers never change the
+    tree, so they can safely share it; only a writer needs it exclusively.
+    
+    Usage:
+        with lock.reader:   # shared - other readers may hold it too
+            ...
+        with lock.writer:   # exclusive - no readers, no other writer
+            ...
+    
+    Fairness:
+        Writers are preferred. Once a writer is waiting, new readers queue
+        behind it, so a steady stream of searches can't starve inserts.
+    
+    Optimistic reads:
+        'version' is a sequence counter: every writer bumps it once when it
+        gets the lock (making it odd) and again when it lets go (even).
+        A short read can skip the lock entirely: note an even version, do
+        the read, and keep the result only if the version hasn't moved.
+        See AVLTree._read_optimistic.
+    
+    Warning:
+        Like threading.Lock, this lock is NOT reentrant. A thread that
+        holds it (in either mode) must not acquire it again: a nested read
+        would wait behind any queued writer, which in turn waits for the
+        outer read to finish - a deadlock.
+    """
+    
+    __slots__ = ('_cond', '_readers', '_writer', '_writers_waiting',
+                 'version', 'reader', 'writer')
+    
+    def __init__(self) -> None:
+        # One Condition guards the three counters below; readers and
+        # writers sleep on it until the state lets them in.
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0            # Threads currently reading.
+        self._writer = False         # True while a writer holds the lock.
+        self._writers_waiting = 0    # Writers blocked in acquire_write().
+        self.version = 0             # Odd while a writer holds the lock.
+        
+        # Pre-built context managers, so 'with lock.reader:' allocates
+        # nothing per call.
+        self.reader = _ReadGuard(self)
+        self.writer = _WriteGuard(self)
+    
+    def acquire_read(self) -> None:
+        """Block until no writer holds or is waiting for the lock."""
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+    
+    def release_read(self) -> None:
+        """Release a shared hold; wake writers once the last reader leaves."""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+    
+    def acquire_write(self) -> None:
+        """Block until there are no readers and no other writer."""
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+            self.version += 1
+    
+    def release_write(self) -> None:
+        """Release the exclusive hold and wake everyone waiting."""
+        with self._cond:
+            self.version += 1
+            self._writer = False
+            self._cond.notify_all()
+
+
+class _NoLock:
+    """
+    Stand-in for _ReadWriteLock in trees created with thread_safe=False.
+    
+    'with lock.reader:' and 'with lock.writer:' do nothing, and version
+    never changes, so optimistic reads always succeed on the first try.
+    Stateless, so one shared instance (_NO_LOCK) serves every such tree.
+    """
+    
+    __slots__ = ('version', 'reader', 'writer')
+    
+    def __init__(self) -> None:
+        self.version = 0
+        self.reader = self.writer = nullcontext()
+
+
+_NO_LOCK = _NoLock()
+
+
+class _ReadGuard:
+    """Context manager taking a _ReadWriteLock in shared (read) mode."""
+    
+    __slots__ = ('_lock',)
+    
+    def __init__(self, lock: _ReadWriteLock) -> None:
+        self._lock = lock
+    
+    def __enter__(self) -> None:
+        self._lock.acquire_read()
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self._lock.release_read()
+
+
+class _WriteGuard:
+    """Context manager taking a _ReadWriteLock in exclusive (write) mode."""
+    
+    __slots__ = ('_lock',)
+    
+    def __init__(self, lock: _ReadWriteLock) -> None:
+        self._lock = lock
+    
+    def __enter__(self) -> None:
+        self._lock.acquire_write()
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self._lock.release_write()
+
+
 # =============================================================================
 # AVL NODE CLASS
 # =============================================================================
@@ -131,6 +291,9 @@ class AVLNode:
         left: Reference to the left child node (or None).
         right: Reference to the right child node (or None).
         height: The height of the subtree rooted at this node.
+        size: The number of nodes in the subtree rooted at this node
+              (itself included). Lets AVLTree.rank() count smaller keys
+              in O(log n) instead of walking them.
     
     Note:
         This class is intentionally simple. All the complex logic lives
@@ -141,7 +304,12 @@ class AVLNode:
     # attributes this class will have. This prevents Python from creating
     # a __dict__ for each instance, saving ~100 bytes per node. For a tree
     # with millions of nodes, this adds up significantly.
-    __slots__ = ['val', 'left', 'right', 'height']
+    #
+    # A slotted node is 5 pointers plus the object header (~72 bytes on
+    # 64-bit CPython). The height needs no packing: AVL heights stay far
+    # below 256, and CPython shares one cached object for each small int,
+    # so every node's height is just a pointer to an existing int.
+    __slots__ = ('val', 'left', 'right', 'height', 'size')
     
     def __init__(self, key: Any) -> None:
         """
@@ -149,11 +317,12 @@ class AVLNode:
         
         Args:
             key: The value to store in this node. Must be comparable
-                 (support < and > operators) with other keys in the tree.
+                 (support the < operator) with other keys in the tree.
         
         The node starts with:
             - No children (left and right are None)
             - Height of 1 (a single node has height 1)
+            - Size of 1 (the subtree is just this node)
         
         Note:
             We don't validate the key type here because validation happens
@@ -167,7 +336,8 @@ class AVLNode:
                               # Height is the number of edges on the longest path
                               # from this node to a leaf. A leaf has height 1 in our
                               # implementation (some implementations use 0).
-
+        self.size = 1         # Nodes in this subtree, counting itself.
+    
     def __repr__(self) -> str:
         """
         Return a string representation of the node for debugging.
@@ -180,6 +350,285 @@ class AVLNode:
         return f"AVLNode({self.val}, h={self.height})"
 
 
+# =============================================================================
+# ROTATIONS
+# =============================================================================
+#
+# AVL trees maintain balance through four types of rotations:
+#
+# 1. Right Rotation (LL case):
+#    Used when left subtree is too tall and the left child is left-heavy.
+#
+#        z                y
+#       / \              / \
+#      y   T4    =>    x    z
+#     / \             / \  / \
+#    x   T3          T1 T2 T3 T4
+#   / \
+#  T1  T2
+#
+# 2. Left Rotation (RR case):
+#    Mirror image of right rotation.
+#
+# 3. Left-Right Rotation (LR case):
+#    First rotate left on left child, then rotate right on node.
+#
+# 4. Right-Left Rotation (RL case):
+#    First rotate right on right child, then rotate left on node.
+#
+# The double rotations (3 and 4) get their own functions that do both
+# steps at once, so each node's links and height are written only once.
+#
+# The rotations are plain module-level functions rather than AVLTree
+# methods: they only touch the nodes they are given, so there is no need
+# to look them up through 'self' on every call, and every node/height they
+# use is pulled into a local variable first.
+
+
+def _rotate_right(z: AVLNode) -> AVLNode:
+    """
+    Perform a right rotation around node z.
+    
+    This is used when the left subtree is too tall (LL or LR case).
+    
+    Before rotation:
+            z
+           / \
+          y   T4
+         / \
+        x   T3
+    
+    After rotation:
+            y
+           / \
+          x   z
+             / \
+            T3  T4
+    
+    Args:
+        z: The node to rotate around (the unbalanced node).
+    
+    Returns:
+        y: The new root of this subtree.
+    
+    Note:
+        - y becomes the new root
+        - z becomes y's right child
+        - y's original right child (T3) becomes z's left child
+        - Heights must be updated: z first, then y
+    """
+    # Store references to the nodes involved.
+    y = z.left         # y is z's left child (will become new root).
+    T3 = y.right       # T3 is y's right subtree (will move to z's left).
+    
+    # Perform the rotation.
+    y.right = z        # z becomes y's right child.
+    z.left = T3        # T3 becomes z's left child.
+    
+    # Update heights BOTTOM-UP (z first, then y).
+    # This is critical: y's height depends on z's new height.
+    # z's children are T3 and T4; y's are x and z.
+    T4 = z.right
+    x = y.left
+    lh = 0 if T3 is None else T3.height
+    rh = 0 if T4 is None else T4.height
+    z.height = zh = 1 + (lh if lh > rh else rh)
+    lh = 0 if x is None else x.height
+    y.height = 1 + (lh if lh > zh else zh)
+    
+    # Subtree sizes: y's subtree now holds exactly what z's held, and z
+    # keeps T3 and T4.
+    y.size = z.size
+    z.size = (
+        1 + (0 if T3 is None else T3.size) + (0 if T4 is None else T4.size)
+    )
+    
+    # Return the new root of this subtree.
+    return y
+
+
+def _rotate_left(z: AVLNode) -> AVLNode:
+    """
+    Perform a left rotation around node z.
+    
+    This is the mirror image of right rotation.
+    Used when the right subtree is too tall (RR or RL case).
+    
+    Before rotation:
+        z
+       / \
+      T1  y
+         / \
+        T2  x
+    
+    After rotation:
+          y
+         / \
+        z   x
+       / \
+      T1  T2
+    
+    Args:
+        z: The node to rotate around.
+    
+    Returns:
+        y: The new root of this subtree.
+    """
+    y = z.right        # y is z's right child (will become new root).
+    T2 = y.left        # T2 is y's left subtree (will move to z's right).
+    
+    # Perform the rotation.
+    y.left = z         # z becomes y's left child.
+    z.right = T2       # T2 becomes z's right child.
+    
+    # Update heights bottom-up.
+    # z's children are T1 and T2; y's are z and x.
+    T1 = z.left
+    x = y.right
+    lh = 0 if T1 is None else T1.height
+    rh = 0 if T2 is None else T2.height
+    z.height = zh = 1 + (lh if lh > rh else rh)
+    rh = 0 if x is None else x.height
+    y.height = 1 + (zh if zh > rh else rh)
+    
+    # Subtree sizes: y takes over z's total; z keeps T1 and T2.
+    y.size = z.size
+    z.size = (
+        1 + (0 if T1 is None else T1.size) + (0 if T2 is None else T2.size)
+    )
+    
+    return y
+
+
+def _rotate_left_right(z: AVLNode) -> AVLNode:
+    """
+    Perform a left-right double rotation around node z.
+    
+    Same result as rotating left around z.left and then right around z,
+    but x (the left child's right child) is lifted straight to the top.
+    Used when the left subtree is too tall and the left child is
+    right-heavy (LR case).
+    
+    Before rotation:
+            z
+           / \
+          y   T4
+         / \
+        T1  x
+           / \
+          T2  T3
+    
+    After rotation:
+            x
+          /   \
+         y     z
+        / \   / \
+       T1 T2 T3  T4
+    
+    Args:
+        z: The node to rotate around (the unbalanced node).
+    
+    Returns:
+        x: The new root of this subtree.
+    """
+    y = z.left
+    x = y.right        # Exists: y is right-heavy.
+    T2 = x.left
+    T3 = x.right
+    
+    # Perform the rotation.
+    y.right = T2
+    z.left = T3
+    x.left = y
+    x.right = z
+    
+    # Update heights bottom-up: y and z first, then x.
+    T1 = y.left
+    T4 = z.right
+    lh = 0 if T1 is None else T1.height
+    rh = 0 if T2 is None else T2.height
+    y.height = yh = 1 + (lh if lh > rh else rh)
+    lh = 0 if T3 is None else T3.height
+    rh = 0 if T4 is None else T4.height
+    z.height = zh = 1 + (lh if lh > rh else rh)
+    x.height = 1 + (yh if yh > zh else zh)
+    
+    # Subtree sizes: x takes over z's total; y and z keep two subtrees each.
+    x.size = z.size
+    y.size = (
+        1 + (0 if T1 is None else T1.size) + (0 if T2 is None else T2.size)
+    )
+    z.size = (
+        1 + (0 if T3 is None else T3.size) + (0 if T4 is None else T4.size)
+    )
+    
+    return x
+
+
+def _rotate_right_left(z: AVLNode) -> AVLNode:
+    """
+    Perform a right-left double rotation around node z.
+    
+    Mirror image of the left-right rotation: same result as rotating
+    right around z.right and then left around z. Used when the right
+    subtree is too tall and the right child is left-heavy (RL case).
+    
+    Before rotation:
+        z
+       / \
+      T1  y
+         / \
+        x   T4
+       / \
+      T2  T3
+    
+    After rotation:
+            x
+          /   \
+         z     y
+        / \   / \
+       T1 T2 T3  T4
+    
+    Args:
+        z: The node to rotate around (the unbalanced node).
+    
+    Returns:
+        x: The new root of this subtree.
+    """
+    y = z.right
+    x = y.left         # Exists: y is left-heavy.
+    T2 = x.left
+    T3 = x.right
+    
+    # Perform the rotation.
+    z.right = T2
+    y.left = T3
+    x.left = z
+    x.right = y
+    
+    # Update heights bottom-up: z and y first, then x.
+    T1 = z.left
+    T4 = y.right
+    lh = 0 if T1 is None else T1.height
+    rh = 0 if T2 is None else T2.height
+    z.height = zh = 1 + (lh if lh > rh else rh)
+    lh = 0 if T3 is None else T3.height
+    rh = 0 if T4 is None else T4.height
+    y.height = yh = 1 + (lh if lh > rh else rh)
+    x.height = 1 + (zh if zh > yh else yh)
+    
+    # Subtree sizes: x takes over z's total; z and y keep two subtrees each.
+    x.size = z.size
+    z.size = (
+        1 + (0 if T1 is None else T1.size) + (0 if T2 is None else T2.size)
+    )
+    y.size = (
+        1 + (0 if T3 is None else T3.size) + (0 if T4 is None else T4.size)
+    )
+    
+    return x
+
+
 # =============================================================================
 # AVL TREE CLASS
 # =============================================================================
@@ -193,11 +642,13 @@ class AVLTree:
     time complexity for insert, delete, and search operations.
     
     Thread Safety:
-        All public methods acquire a reentrant lock (RLock) before modifying
-        or reading the tree. This allows safe concurrent access from multiple
-        threads. The RLock (vs regular Lock) allows the same thread to call
-        multiple methods without deadlocking (e.g., a method that calls
-        another public method internally).
+        All public methods acquire a lock before modifying or reading the
+        tree. This allows safe concurrent access from multiple threads.
+        The lock is a readers-writer lock: any number of readers (search,
+        'in', len, traversals) may hold it together, while insert, delete
+        and the bulk loaders hold it alone. It is not reentrant, so public
+        methods never call each other while holding it; they share
+        unlocked helpers.
     
     Resource Limits:
         - max_size: Maximum number of nodes allowed (prevents memory exhaustion)
@@ -226,7 +677,9 @@ class AVLTree:
         self,
         max_size: Optional[int] = None,
         max_depth: int = 1000,
-        enable_logging: bool = False
+        enable_logging: bool = False,
+        validate_keys: bool = True,
+        thread_safe: bool = True
     ) -> None:
         """
         Initialize an empty AVL tree with optional resource limits.
@@ -246,6 +699,20 @@ class AVLTree:
                             Set to False in production if keys may contain
                             sensitive data (PII, tokens, etc.) to prevent
                             data leakage through log files.
+            
+            validate_keys: If False, only reject None keys and skip the
+                           comparability check. Use this when the caller
+                           builds every key itself and knows they are
+                           comparable; it saves a trial comparison per
+                           insert/delete/search.
+            
+            thread_safe: If False, the tree does no locking at all. Only
+                         use this when the tree is never touched by more
+                         than one thread (e.g. a short-lived tree in a
+                         script or inside a single request). It removes
+                         the readers-writer lock's bookkeeping from every
+                         call, which is most of the cost of an operation
+                         on a small tree.
         
         Thread Safety:
             The constructor itself is not thread-safe, but this is expected—
@@ -263,6 +730,11 @@ class AVLTree:
         # Maximum allowed nodes. Used to prevent memory exhaustion attacks.
         self._max_size: Optional[int] = max_size
         
+        # The same limit as a plain number, with "no limit" stored as
+        # infinity. insert() then needs a single comparison against it
+        # instead of a None test plus a comparison on every call.
+        self._size_limit: float = float('inf') if max_size is None else max_size
+        
         # Maximum allowed depth. Used to prevent stack overflow from deep recursion.
         # Python's default recursion limit is ~1000, so we use that as default.
         self._max_depth: int = max_depth
@@ -270,18 +742,51 @@ class AVLTree:
         # Controls whether operations are logged. Disabled by default for security.
         self._enable_logging: bool = enable_logging
         
-        # Threading lock for synchronization.
-        # We use RLock (reentrant lock) instead of Lock because:
-        # 1. It allows the same thread to acquire the lock multiple times
-        # 2. This is needed when public methods call other public methods
-        # 3. It prevents deadlock when code is refactored
+        # Trusted callers opt out of the full key check. The instance
+        # attribute shadows the method, so call sites stay unchanged.
+        if not validate_keys:
+            self._validate_key = self._validate_key_not_none
+        
+        # Readers-writer lock for synchronization.
+        # Methods that only look at the tree (search, 'in', len, size,
+        # traversals, ...) take it in shared mode ('with self._lock.reader:')
+        # and run alongside each other. insert/delete/clear/bulk loads take
+        # it in exclusive mode ('with self._lock.writer:').
         #
-        # How RLock works:
-        # - First acquire() by a thread: lock is acquired, count = 1
-        # - Second acquire() by SAME thread: count = 2 (no blocking)
-        # - release(): count decrements, lock released when count = 0
-        # - acquire() by DIFFERENT thread: blocks until count = 0
-        self._lock: threading.RLock = threading.RLock()
+        # No public method calls another public method while holding the
+        # lock; internal work goes through unlocked helpers
+        # (_search_unlocked, _insert_iterative, _delete_iterative, ...)
+        #
+        # IMPORTANT: the lock is not reentrant, so code running under
+        # either mode must never call a method that acquires it again
+        # (that would deadlock). Call the unlocked helper instead.
+        #
+        # With thread_safe=False the lock is replaced by _NO_LOCK, whose
+        # reader/writer do nothing; no other code needs to know.
+        self._lock = _ReadWriteLock() if thread_safe else _NO_LOCK
+        
+        # Sorted snapshot of every key.
+        # Built lazily by the first traversal after a change and shared by
+        # every traversal/iteration until the next insert or delete, which
+        # just drops it (None). Once published the list is NEVER modified
+        # (it is only handed out as an iterator or copied), so iterators
+        # can walk it without holding the lock. A list rather than a tuple
+        # avoids copying all n keys a second time when it is built.
+        self._snapshot: Optional[List[Any]] = None
+        
+        # Freelist of nodes unlinked by delete(), reused by insert().
+        # Under insert/delete churn (e.g. re-submitted candidates) this
+        # replaces a full AVLNode() construction - type call plus __init__
+        # frame - with a list pop and four attribute stores. Pooled nodes
+        # have val/left/right cleared so they don't keep keys alive.
+        self._node_pool: List[AVLNode] = []
+        
+        # Smallest and largest keys, or None when empty, kept up to date
+        # by every write so get_min()/get_max() don't walk the tree.
+        # Inserts update them with one or two comparisons; a delete only
+        # walks down the edge of the tree when it removes one of them.
+        self._min_val: Optional[Any] = None
+        self._max_val: Optional[Any] = None
     
     # =========================================================================
     # PYTHON MAGIC METHODS (Dunder Methods)
@@ -299,14 +804,13 @@ class AVLTree:
             The current number of nodes in the tree.
         
         Thread Safety:
-            Acquires the lock to ensure we read a consistent value.
-            Without the lock, we might read a partially-updated size
-            during a concurrent insert or delete.
+            Reads one attribute that writers replace in a single store
+            (like get_min/get_max), so no lock is needed. A concurrent
+            insert or delete is seen either fully or not at all.
         
         Time Complexity: O(1)
         """
-        with self._lock:  # Acquire lock, automatically released when block exits.
-            return self._size
+        return self._size
     
     def __contains__(self, key: Any) -> bool:
         """
@@ -321,7 +825,8 @@ class AVLTree:
             True if the key exists in the tree, False otherwise.
         
         Thread Safety:
-            Uses the search() method which acquires the lock.
+            Tries a lock-free read first and falls back to the read lock
+            if a writer got in the way (see _read_optimistic).
         
         Time Complexity: O(log n)
         
@@ -331,10 +836,7 @@ class AVLTree:
             >>> print(5 in tree)  # True
             >>> print(10 in tree)  # False
         """
-        # We use the internal _search_unlocked method here, but we still
-        # need to acquire the lock ourselves.
-        with self._lock:
-            return self._search_unlocked(self.root, key) is not None
+        return self._read_optimistic(self._find, key) is not None
     
     def __iter__(self) -> Iterator[Any]:
         """
@@ -346,16 +848,23 @@ class AVLTree:
             Values in ascending sorted order.
         
         Thread Safety:
-            Creates a snapshot (list) of values while holding the lock,
-            then iterates over the snapshot. This prevents issues with
-            concurrent modifications during iteration.
+            Grabs the tree's shared snapshot (a sorted list of all values
+            that is never modified) under the read lock, then iterates
+            over it with the lock released. Concurrent inserts/deletes never touch a snapshot
+            that has been handed out; they just stop sharing it.
+        
+        Time Complexity: O(1) to start if the snapshot is current,
+        otherwise O(n) to rebuild it once; then O(1) per iteration.
         
-        Time Complexity: O(n) to create snapshot, then O(1) per iteration.
+        Memory: No per-iteration copy. Every iterator (and traversal)
+        started between two modifications shares the same snapshot, so
+        even an early exit like next(iter(tree)) allocates nothing once
+        the snapshot exists.
         
         Warning:
-            The snapshot is created at the start of iteration. If the tree
-            is modified during iteration, the iterator will not reflect
-            those changes (which is the safe behavior).
+            The snapshot reflects the tree at the moment iteration started.
+            If the tree is modified during iteration, the iterator will not
+            reflect those changes (which is the safe behavior).
         
         Example:
             >>> tree = AVLTree()
@@ -364,17 +873,11 @@ class AVLTree:
             >>> tree.insert(2)
             >>> list(tree)  # [1, 2, 3]
         """
-        with self._lock:
-            # Create a snapshot of all values.
-            # We do this inside the lock to get a consistent view.
-            snapshot: List[Any] = []
-            self._in_order_traversal(self.root, snapshot)
+        snapshot = self._shared_snapshot()
         
-        # Iterate over the snapshot OUTSIDE the lock.
-        # This allows other threads to modify the tree while we iterate.
-        # The caller sees the tree as it was when iteration started.
-        for value in snapshot:
-            yield value  # yield makes this a generator function.
+        # Iterate OUTSIDE the lock; the snapshot can't change underneath us,
+        # and other threads are free to modify the tree meanwhile.
+        return iter(snapshot)
     
     def __repr__(self) -> str:
         """
@@ -387,7 +890,7 @@ class AVLTree:
             >>> tree = AVLTree(max_size=100)
             >>> print(tree)  # AVLTree(size=0, root=None, max_size=100)
         """
-        with self._lock:
+        with self._lock.reader:
             root_val = self.root.val if self.root else None
             return f"AVLTree(size={self._size}, root={root_val}, max_size={self._max_size})"
     
@@ -406,9 +909,11 @@ class AVLTree:
         
         Returns:
             The current number of nodes.
+        
+        Thread Safety:
+            Lock-free, as for len(tree).
         """
-        with self._lock:
-            return self._size
+        return self._size
     
     @property
     def height(self) -> int:
@@ -418,8 +923,8 @@ class AVLTree:
         Returns:
             The height of the tree, or 0 if empty.
         """
-        with self._lock:
-            return self._get_height(self.root)
+        with self._lock.reader:
+            return 0 if self.root is None else self.root.height
     
     @property
     def is_empty(self) -> bool:
@@ -429,7 +934,7 @@ class AVLTree:
         Returns:
             True if the tree has no nodes, False otherwise.
         """
-        with self._lock:
+        with self._lock.reader:
             return self.root is None
     
     # =========================================================================
@@ -440,7 +945,8 @@ class AVLTree:
         """
         Validate that a key can be used in the tree.
         
-        A valid key must be comparable (support < and > operators).
+        A valid key must be comparable (support the < operator; the tree
+        never uses any other comparison).
         This method raises an exception if the key is invalid.
         
         Args:
@@ -464,22 +970,37 @@ class AVLTree:
         if key is None:
             raise AVLTreeKeyError("Key cannot be None")
         
+        # Fast path: plain ints, floats, strings and bytes are always
+        # comparable, so there is nothing more to check.
+        if type(key) in _TRUSTED_KEY_TYPES:
+            return
+        
         # Test that the key is comparable with itself.
-        # This catches objects that don't implement __lt__ and __gt__.
-        # We do this by actually trying the comparison operations.
+        # This catches objects that don't implement __lt__.
+        # We do this by actually trying the comparison operation.
         try:
-            # These comparisons should both return False for equal values.
+            # This comparison should return False for equal values.
             # We don't care about the result; we're just checking if the
-            # operations are supported.
+            # operation is supported.
             _ = key < key  # Test less-than operator
-            _ = key > key  # Test greater-than operator
         except TypeError as e:
             # TypeError is raised when comparison operators aren't defined.
             # We convert this to our custom exception for clarity.
             raise AVLTreeKeyError(
-                f"Key must be comparable (support < and > operators): {e}"
+                f"Key must be comparable (support the < operator): {e}"
             )
     
+    def _validate_key_not_none(self, key: Any) -> None:
+        """
+        Minimal key check used when the tree was built with
+        validate_keys=False: only None is rejected.
+        
+        Raises:
+            AVLTreeKeyError: If the key is None.
+        """
+        if key is None:
+            raise AVLTreeKeyError("Key cannot be None")
+    
     # =========================================================================
     # PUBLIC METHODS - INSERT
     # =========================================================================
@@ -520,35 +1041,24 @@ class AVLTree:
         # Acquire the lock for all tree modifications.
         # The 'with' statement ensures the lock is released even if
         # an exception occurs inside the block.
-        with self._lock:
+        with self._lock.writer:
             # Check capacity limit.
             # We do this inside the lock to prevent race conditions where
             # two threads both check, both see space, and both insert.
-            if self._max_size is not None and self._size >= self._max_size:
+            if self._size >= self._size_limit:
                 raise AVLTreeCapacityError(
                     f"Tree has reached maximum capacity of {self._max_size} nodes"
                 )
             
-            # Check depth limit.
-            # In a balanced AVL tree, max nodes ≈ 2^depth, so we can
-            # calculate if we're approaching the depth limit.
-            # A more precise check happens during the actual insertion.
-            current_height = self._get_height(self.root)
-            if current_height >= self._max_depth:
-                raise AVLTreeDepthError(
-                    f"Tree has reached maximum depth of {self._max_depth}"
-                )
-            
-            # Track the original size to detect if insertion succeeded.
-            original_size = self._size
-            
-            # Perform the recursive insertion.
-            # _insert_recursive returns the new root of the tree (which may
-            # change due to rotations) and updates self._size if successful.
-            self.root = self._insert_recursive(self.root, key, depth=0)
+            # The depth limit is checked during the insertion itself,
+            # against the exact depth the new node would land at (see
+            # _insert_iterative), so there is no separate height check here.
             
-            # Check if the size changed (i.e., insertion was successful).
-            inserted = self._size > original_size
+            # Perform the insertion.
+            # _insert_iterative attaches the new node, rebalances on the
+            # way back up (updating self.root if a rotation reaches it),
+            # and reports whether a node was actually added.
+            inserted = self._insert_iterative(key)
             
             # Log the operation if logging is enabled.
             if self._enable_logging:
@@ -559,86 +1069,160 @@ class AVLTree:
             
             return inserted
     
-    def _insert_recursive(
-        self,
-        node: Optional[AVLNode],
-        key: Any,
-        depth: int
-    ) -> AVLNode:
+    def _insert_iterative(self, key: Any) -> bool:
         """
-        Recursively insert a key into the subtree rooted at 'node'.
+        Insert a key without recursion.
         
-        This is the internal recursive implementation of insert. It:
-        1. Finds the correct position for the new key
-        2. Creates a new node
-        3. Updates heights on the way back up
-        4. Rebalances if necessary
+        This is the internal implementation of insert. It:
+        1. Walks down from the root, remembering every node it passes
+        2. Attaches a new leaf at the insertion point
+        3. Walks back up that path updating heights and rebalancing
+           (see _retrace)
         
         Args:
-            node: The root of the current subtree (may be None).
             key: The key to insert.
-            depth: Current depth in the tree (for depth limit checking).
         
         Returns:
-            The new root of the subtree after insertion and rebalancing.
-            This may be different from 'node' if a rotation occurred.
+            True if a new node was added, False if the key was a duplicate.
         
         Raises:
-            AVLTreeDepthError: If depth exceeds max_depth.
+            AVLTreeDepthError: If the new node would sit deeper than
+                               max_depth.
         
         Note:
             This method assumes the lock is already held by the caller.
             It should only be called from insert().
         
-        How recursion works here:
-            1. We traverse down the tree, choosing left or right at each node
-            2. When we hit None, we create and return the new node
-            3. As the recursion unwinds (returns back up), we:
-               - Update the height of each node
-               - Check and fix balance at each node
-            4. The final return gives us the (possibly new) root
-        """
-        # Check depth limit to prevent stack overflow.
-        # Each recursive call increases depth by 1.
-        if depth > self._max_depth:
+        Why iterative:
+            A recursive insert costs one Python call frame per level, and
+            each frame (argument binding, return, reassigning the child
+            pointer) is much more expensive than the comparison it wraps.
+            Keeping the path in a plain list does the same job in a loop
+            and removes any dependence on Python's recursion limit.
+        """
+        # WALK DOWN, recording the path from the root to the insertion point.
+        path: List[AVLNode] = []
+        node = self.root
+        
+        while node is not None:
+            path.append(node)
+            val = node.val
+            if key < val:
+                # Key is smaller: it belongs in the left subtree.
+                node = node.left
+            elif val < key:
+                # Key is larger: it belongs in the right subtree.
+                node = node.right
+            else:
+                # Key equals node.val: it's a duplicate.
+                # AVL trees typically don't allow duplicates.
+                return False
+        
+        # Check depth limit. The new node will sit one level below
+        # the last node on the path, at depth len(path) + 1. Since the
+        # tree's height only grows when a node lands below the current
+        # deepest level, this also keeps the height within max_depth.
+        if len(path) >= self._max_depth:
             raise AVLTreeDepthError(
                 f"Insertion would exceed maximum depth of {self._max_depth}"
             )
         
-        # BASE CASE: We've found the insertion point.
-        # When node is None, we've traversed past a leaf.
-        # Create and return a new node to be attached by the parent.
-        if node is None:
-            self._size += 1  # Increment size since we're adding a node.
-            return AVLNode(key)  # Return the new node.
-        
-        # RECURSIVE CASE: Traverse left or right based on comparison.
-        if key < node.val:
-            # Key is smaller: it belongs in the left subtree.
-            # We recursively insert into the left subtree and update
-            # node.left with whatever comes back (may be new node or
-            # rotated subtree).
-            node.left = self._insert_recursive(node.left, key, depth + 1)
-        elif key > node.val:
-            # Key is larger: it belongs in the right subtree.
-            node.right = self._insert_recursive(node.right, key, depth + 1)
+        # ATTACH the new leaf to the last node on the path, recycling a
+        # node freed by an earlier delete if one is available.
+        pool = self._node_pool
+        if pool:
+            new_node = pool.pop()
+            new_node.val = key
+            new_node.height = 1  # left/right were cleared when pooled.
+            new_node.size = 1
+        else:
+            new_node = AVLNode(key)
+        self._size += 1
+        self._snapshot = None  # Keys changed; rebuild on next traversal.
+        
+        if not path:
+            # Empty tree: the new node is the root (and min and max).
+            self.root = new_node
+            self._min_val = self._max_val = key
+            return True
+        
+        # Keep the cached extremes current.
+        if key < self._min_val:
+            self._min_val = key
+        elif self._max_val < key:
+            self._max_val = key
+        
+        parent = path[-1]
+        if key < parent.val:
+            parent.left = new_node
         else:
-            # Key equals node.val: it's a duplicate.
-            # AVL trees typically don't allow duplicates.
-            # Return the node unchanged (don't increment size).
-            return node
-        
-        # UPDATE HEIGHT after insertion.
-        # The height of a node is 1 plus the maximum height of its children.
-        # We must do this BEFORE rebalancing because _rebalance uses heights.
-        node.height = 1 + max(
-            self._get_height(node.left),
-            self._get_height(node.right)
-        )
-        
-        # REBALANCE if necessary.
-        # Returns 'node' if balanced, or new subtree root if rotated.
-        return self._rebalance(node)
+            parent.right = new_node
+        
+        # Every node on the path gained one descendant. (Unlike heights,
+        # sizes change all the way to the root, so this can't stop early.)
+        for node in path:
+            node.size += 1
+        
+        # WALK BACK UP, fixing heights and balance.
+        self._retrace(path)
+        return True
+    
+    def _retrace(self, path: List[AVLNode]) -> None:
+        """
+        Update heights and rebalance along a root-to-node path, bottom-up.
+        
+        Called after a child of path[-1] has changed (a leaf was attached
+        or a node was unlinked). Each node's height is recomputed and the
+        node is rebalanced; if a rotation gives the subtree a new root, it
+        is linked into the parent (path[i - 1]) or becomes self.root.
+        
+        Args:
+            path: Nodes from the root down to the parent of the change.
+        
+        Early exit:
+            Ancestors only depend on a subtree's HEIGHT. As soon as a
+            subtree (after any rotation) has the same height it had before
+            the change, nothing above it can be affected, so we stop. For
+            inserts this usually happens within a level or two.
+        
+        Note:
+            This method assumes the lock is already held.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            
+            # UPDATE HEIGHT from the (possibly changed) children.
+            # Child heights are read once into locals and reused for the
+            # balance check below (None children have height 0).
+            left = node.left
+            right = node.right
+            lh = 0 if left is None else left.height
+            rh = 0 if right is None else right.height
+            node.height = 1 + (lh if lh > rh else rh)
+            
+            # REBALANCE only if this node is actually out of balance.
+            # Returns the new subtree root if a rotation occurred.
+            balance = lh - rh
+            if balance > 1 or balance < -1:
+                subtree = self._rebalance(node, balance)
+            else:
+                subtree = node
+            
+            if subtree is not node:
+                # Link the rotated subtree back into the tree.
+                if i == 0:
+                    self.root = subtree
+                else:
+                    parent = path[i - 1]
+                    if parent.left is node:
+                        parent.left = subtree
+                    else:
+                        parent.right = subtree
+            
+            if subtree.height == old_height:
+                # Height unchanged: ancestors are already correct.
+                break
     
     # =========================================================================
     # PUBLIC METHODS - DELETE
@@ -673,13 +1257,9 @@ class AVLTree:
         """
         self._validate_key(key)
         
-        with self._lock:
-            original_size = self._size
-            
-            # Perform recursive deletion.
-            self.root = self._delete_recursive(self.root, key)
-            
-            deleted = self._size < original_size
+        with self._lock.writer:
+            # Perform the deletion (rebalancing and root updates included).
+            deleted = self._delete_iterative(key)
             
             if self._enable_logging:
                 if deleted:
@@ -689,84 +1269,108 @@ class AVLTree:
             
             return deleted
     
-    def _delete_recursive(
-        self,
-        node: Optional[AVLNode],
-        key: Any
-    ) -> Optional[AVLNode]:
+    def _delete_iterative(self, key: Any) -> bool:
         """
-        Recursively delete a key from the subtree rooted at 'node'.
+        Delete a key without recursion.
         
         Deletion in a BST has three cases:
         1. Node has no children: just remove it
         2. Node has one child: replace node with its child
         3. Node has two children: replace with in-order successor
         
-        After deletion, we rebalance on the way back up.
+        As with _insert_iterative, the path from the root is kept in a
+        list and then retraced bottom-up to fix heights and balance.
         
         Args:
-            node: The root of the current subtree.
             key: The key to delete.
         
         Returns:
-            The new root of the subtree after deletion and rebalancing.
-            Returns None if the subtree becomes empty.
+            True if the key was found and removed, False otherwise.
         
         Note:
             This method assumes the lock is already held.
         """
-        # BASE CASE: Key not found.
-        # We've traversed past a leaf without finding the key.
+        # SEARCH for the key, recording the path to it.
+        path: List[AVLNode] = []
+        node = self.root
+        
+        while node is not None:
+            val = node.val
+            if key < val:
+                # Key would be in left subtree.
+                path.append(node)
+                node = node.left
+            elif val < key:
+                # Key would be in right subtree.
+                path.append(node)
+                node = node.right
+            else:
+                # FOUND IT!
+                break
+        
         if node is None:
-            return None
+            # Key not found.
+            return False
         
-        # SEARCH for the key.
-        if key < node.val:
-            # Key would be in left subtree.
-            node.left = self._delete_recursive(node.left, key)
-        elif key > node.val:
-            # Key would be in right subtree.
-            node.right = self._delete_recursive(node.right, key)
-        else:
-            # FOUND IT! Now handle the three deletion cases.
-            
-            # Case 1 & 2: Node has at most one child.
-            if node.left is None:
-                # No left child: return right child (may be None).
-                self._size -= 1
-                return node.right
-            elif node.right is None:
-                # No right child: return left child.
-                self._size -= 1
-                return node.left
-            
-            # Case 3: Node has two children.
-            # Strategy: Replace this node's value with its in-order successor
-            # (smallest value in right subtree), then delete that successor.
-            #
-            # Why in-order successor? It's the smallest value that's larger
-            # than all values in the left subtree, so it maintains BST order.
-            
-            # Find the in-order successor (minimum in right subtree).
-            successor = self._get_min_node(node.right)
+        # Case 3: Node has two children.
+        # Strategy: Replace this node's value with its in-order successor
+        # (smallest value in right subtree), then unlink the successor.
+        #
+        # Why in-order successor? It's the smallest value that's larger
+        # than all values in the left subtree, so it maintains BST order.
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
             
             # Copy the successor's value to this node.
             # The node isn't actually deleted; its value is replaced.
             node.val = successor.val
             
-            # Delete the successor from the right subtree.
-            # The successor has at most one child (right), so this is
-            # simpler than the general case.
-            node.right = self._delete_recursive(node.right, successor.val)
+            # The successor has no left child, so it falls into case 1/2.
+            node = successor
+        
+        # Case 1 & 2: Node has at most one child; splice it out.
+        child = node.left if node.left is not None else node.right
         
-        # UPDATE HEIGHT after potential deletion in subtree.
-        node.height = 1 + max(
-            self._get_height(node.left),
-            self._get_height(node.right)
-        )
+        if not path:
+            self.root = child
+        else:
+            parent = path[-1]
+            if parent.left is node:
+                parent.left = child
+            else:
+                parent.right = child
+        
+        self._size -= 1
+        self._snapshot = None  # Keys changed; rebuild on next traversal.
+        
+        # Every node on the path lost one descendant.
+        for ancestor in path:
+            ancestor.size -= 1
+        
+        # Fix heights and balance from the unlinked node's parent upward.
+        self._retrace(path)
+        
+        # If the deleted key was the min or max, find the new one.
+        root = self.root
+        if root is None:
+            self._min_val = self._max_val = None
+        else:
+            if not self._min_val < key:
+                self._min_val = self._get_min_node(root).val
+            if not key < self._max_val:
+                self._max_val = self._get_max_node(root).val
+        
+        # Keep the unlinked node for the next insert (up to a limit).
+        if len(self._node_pool) < _NODE_POOL_LIMIT:
+            node.val = None
+            node.left = node.right = None
+            self._node_pool.append(node)
         
-        # REBALANCE if necessary.
-        return self._rebalance(node)
+        return True
     
     # =========================================================================
     # PUBLIC METHODS - SEARCH
@@ -781,12 +1385,16 @@ class AVLTree:
         
         Returns:
             The node containing the key, or None if not found.
+            The node belongs to the tree: read it right away rather than
+            holding on to it, since a later delete may move another value
+            into it or recycle it for a new key.
         
         Raises:
             AVLTreeKeyError: If the key is None or not comparable.
         
         Thread Safety:
-            Acquires the lock during the search.
+            Tries a lock-free read first and falls back to the read lock
+            if a writer got in the way (see _read_optimistic).
         
         Time Complexity: O(log n) average and worst case.
         
@@ -798,16 +1406,19 @@ class AVLTree:
         """
         self._validate_key(key)
         
-        with self._lock:
-            result = self._search_unlocked(self.root, key)
-            
-            if self._enable_logging:
-                if result:
-                    logger.debug(f"Key {key} found in AVL tree")
-                else:
-                    logger.debug(f"Key {key} not found in AVL tree")
-            
-            return result
+        result = self._read_optimistic(self._find, key)
+        
+        if self._enable_logging:
+            if result:
+                logger.debug(f"Key {key} found in AVL tree")
+            else:
+                logger.debug(f"Key {key} not found in AVL tree")
+        
+        return result
+    
+    def _find(self, key: Any) -> Optional[AVLNode]:
+        """Search the whole tree, reading the root as the first step."""
+        return self._search_unlocked(self.root, key)
     
     def _search_unlocked(
         self,
@@ -834,23 +1445,144 @@ class AVLTree:
         # Iterative search is used instead of recursive for two reasons:
         # 1. No risk of stack overflow regardless of tree depth
         # 2. Slightly faster (no function call overhead)
+        #
+        # Only the < operator is used (never > or ==): "neither smaller nor
+        # larger" means equal. Passing through a node costs one comparison
+        # on the left branch and two otherwise, and keys only need __lt__.
         
         current = node  # Start at the given node (usually root).
         
         while current is not None:
-            if key == current.val:
-                # Found it!
-                return current
-            elif key < current.val:
+            val = current.val
+            if key < val:
                 # Key would be in left subtree.
                 current = current.left
-            else:
+            elif val < key:
                 # Key would be in right subtree.
                 current = current.right
+            else:
+                # Found it!
+                return current
         
         # Traversed to a None child: key not found.
         return None
     
+    def rank(self, key: Any) -> int:
+        """
+        Count the keys in the tree that are smaller than key.
+        
+        This is key's 0-based position in sorted order (or the position
+        it would be inserted at, if it isn't in the tree), so
+        tree.to_list()[tree.rank(k)] == k for any stored k.
+        
+        Args:
+            key: The value to rank. Doesn't have to be in the tree.
+        
+        Returns:
+            The number of stored keys strictly less than key.
+        
+        Raises:
+            AVLTreeKeyError: If the key is None or not comparable.
+        
+        Thread Safety:
+            Tries a lock-free read first and falls back to the read lock
+            if a writer got in the way (see _read_optimistic).
+        
+        Time Complexity: O(log n), using the subtree sizes stored on the
+        nodes; no traversal or snapshot is needed.
+        
+        Example:
+            >>> tree = AVLTree()
+            >>> for k in (10, 20, 30):
+            ...     tree.insert(k)
+            >>> tree.rank(20)  # 1 (only 10 is smaller)
+            >>> tree.rank(25)  # 2
+        """
+        self._validate_key(key)
+        return self._read_optimistic(self._rank_unlocked, key)
+    
+    def select(self, index: int) -> Any:
+        """
+        Return the key at a 0-based position in sorted order.
+        
+        The inverse of rank(): tree.select(i) == tree.to_list()[i], but
+        found in O(log n) from the subtree sizes instead of building the
+        list. Negative indexes count from the end, as with lists.
+        
+        Args:
+            index: Position in ascending order.
+        
+        Returns:
+            The key at that position.
+        
+        Raises:
+            IndexError: If index is out of range.
+        
+        Thread Safety:
+            Tries a lock-free read first and falls back to the read lock
+            if a writer got in the way (see _read_optimistic).
+        
+        Example:
+            >>> tree = AVLTree()
+            >>> for k in (10, 20, 30):
+            ...     tree.insert(k)
+            >>> tree.select(0)   # 10
+            >>> tree.select(-1)  # 30
+        """
+        return self._read_optimistic(self._select_unlocked, index)
+    
+    def _select_unlocked(self, index: int) -> Any:
+        """
+        Find the key at a sorted position without acquiring the lock.
+        
+        At each node, the left subtree holds the first left.size keys and
+        the node itself comes next; go left, stop, or skip past both and
+        go right.
+        """
+        root = self.root
+        size = 0 if root is None else root.size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("AVLTree index out of range")
+        
+        current = root
+        while True:
+            left = current.left
+            left_size = 0 if left is None else left.size
+            if index < left_size:
+                current = left
+            elif index == left_size:
+                return current.val
+            else:
+                index -= left_size + 1
+                current = current.right
+    
+    def _rank_unlocked(self, key: Any) -> int:
+        """
+        Count keys smaller than key without acquiring the lock.
+        
+        Walks down as in a search. Every time the walk goes right, the
+        node it leaves and that node's whole left subtree are smaller
+        than key, so they are added to the count.
+        """
+        count = 0
+        current = self.root
+        
+        while current is not None:
+            val = current.val
+            left = current.left
+            if key < val:
+                current = left
+            elif val < key:
+                count += 1 + (0 if left is None else left.size)
+                current = current.right
+            else:
+                # Found it: everything in its left subtree is smaller.
+                return count + (0 if left is None else left.size)
+        
+        return count
+    
     # =========================================================================
     # PUBLIC METHODS - TRAVERSAL
     # =========================================================================
@@ -866,9 +1598,12 @@ class AVLTree:
             A list of all values in ascending order.
         
         Thread Safety:
-            Acquires the lock and creates a snapshot.
+            Copies the shared snapshot under the read lock, rebuilding it
+            first if a modification made it stale.
         
-        Time Complexity: O(n) where n is the number of nodes.
+        Time Complexity: O(n) where n is the number of nodes. Repeat calls
+        with no modification in between copy the cached snapshot (a single
+        C-level copy) instead of walking the tree again.
         
         Example:
             >>> tree = AVLTree()
@@ -877,38 +1612,236 @@ class AVLTree:
             >>> tree.insert(7)
             >>> tree.in_order_traversal()  # [3, 5, 7]
         """
-        with self._lock:
+        # A fresh list each time: callers are free to modify it.
+        result = list(self._shared_snapshot())
+        
+        if self._enable_logging:
+            logger.debug(f"In-order traversal: {result}")
+        
+        return result
+    
+    def nlargest(self, n: int) -> List[Any]:
+        """
+        Return the n largest values, largest first.
+        
+        Unlike in_order_traversal() this never materializes the whole
+        tree: it walks down the right spine and then visits nodes in
+        reverse order, stopping as soon as it has n values.
+        
+        Args:
+            n: How many values to return (fewer if the tree is smaller).
+        
+        Returns:
+            A list of at most n values in descending order.
+        
+        Thread Safety:
+            Runs under the read lock. The walk uses an explicit stack and
+            does not touch the tree's links, so readers can share it.
+        
+        Time Complexity: O(log n + k) for k returned values. If the shared
+        snapshot is current it is simply sliced.
+        
+        Example:
+            >>> tree = AVLTree.from_list([5, 3, 8, 1])
+            >>> tree.nlargest(2)  # [8, 5]
+        """
+        return self._bounded_walk(n, reverse=True)
+    
+    def nsmallest(self, n: int) -> List[Any]:
+        """
+        Return the n smallest values, smallest first.
+        
+        The mirror image of nlargest().
+        
+        Args:
+            n: How many values to return (fewer if the tree is smaller).
+        
+        Returns:
+            A list of at most n values in ascending order.
+        
+        Time Complexity: O(log n + k) for k returned values.
+        
+        Example:
+            >>> tree = AVLTree.from_list([5, 3, 8, 1])
+            >>> tree.nsmallest(2)  # [1, 3]
+        """
+        return self._bounded_walk(n, reverse=False)
+    
+    def _bounded_walk(self, n: int, reverse: bool) -> List[Any]:
+        """
+        Collect up to n values from one end of the in-order sequence.
+        
+        Args:
+            n: Maximum number of values to collect.
+            reverse: True to start from the largest value.
+        
+        Note:
+            This method acquires the read lock itself.
+        """
+        if n <= 0:
+            return []
+        
+        with self._lock.reader:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                if reverse:
+                    return snapshot[:-n - 1:-1]
+                return snapshot[:n]
+            
             result: List[Any] = []
-            self._in_order_traversal(self.root, result)
+            append = result.append
+            stack: List[AVLNode] = []
+            push = stack.append
+            pop = stack.pop
+            node = self.root
             
-            if self._enable_logging:
-                logger.debug(f"In-order traversal: {result}")
+            # Iterative in-order walk; for reverse order the roles of the
+            # left and right children are swapped.
+            while True:
+                while node is not None:
+                    push(node)
+                    node = node.right if reverse else node.left
+                if not stack:
+                    break
+                node = pop()
+                append(node.val)
+                if len(result) == n:
+                    break
+                node = node.left if reverse else node.right
             
             return result
     
+    def _shared_snapshot(self) -> List[Any]:
+        """
+        Return the shared sorted list of all values, taking the lock.
+        
+        Everything, including a rebuild, happens under the read lock: the
+        rebuild walks the tree with an explicit stack and never touches
+        its links, so it doesn't shut out other readers or bump the
+        seqlock version the way taking the write lock would. Writers are
+        excluded while the read lock is held, so the rebuilt list is
+        current when it is stored; two readers racing to rebuild simply
+        store equal lists.
+        
+        Note:
+            This method acquires the lock itself; don't call it with the
+            lock held.
+        """
+        with self._lock.reader:
+            snapshot = self._snapshot
+            if snapshot is None:
+                snapshot = []
+                self._stack_in_order_traversal(self.root, snapshot)
+                self._snapshot = snapshot
+        
+        return snapshot
+    
+    def _get_snapshot(self) -> List[Any]:
+        """
+        Return the shared sorted list of all values, rebuilding it if stale.
+        
+        The returned list must not be modified; copy it first.
+        
+        Note:
+            This method assumes the WRITE lock is already held (a rebuild
+            temporarily modifies the tree; see _in_order_traversal). Readers
+            use _shared_snapshot() instead.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = []
+            self._in_order_traversal(self.root, snapshot)
+            self._snapshot = snapshot
+        return snapshot
+    
+    def _stack_in_order_traversal(
+        self,
+        node: Optional[AVLNode],
+        output: List[Any]
+    ) -> None:
+        """
+        Perform in-order traversal with an explicit stack.
+        
+        Unlike the Morris walk below it never modifies the tree, so it is
+        safe under the shared read lock. The stack is only O(log n) deep,
+        and in CPython the walk is no slower than Morris.
+        
+        Args:
+            node: Root of the subtree to visit.
+            output: List to append values to.
+        """
+        append = output.append
+        stack: List[AVLNode] = []
+        push = stack.append
+        pop = stack.pop
+        
+        while True:
+            while node is not None:
+                push(node)
+                node = node.left
+            if not stack:
+                return
+            node = pop()
+            append(node.val)
+            node = node.right
+    
     def _in_order_traversal(
         self,
         node: Optional[AVLNode],
         output: List[Any]
     ) -> None:
         """
-        Recursively perform in-order traversal.
+        Perform in-order traversal using Morris threading.
+        
+        Morris traversal needs no recursion and no explicit stack. Before
+        descending into a node's left subtree, it points the right link of
+        that subtree's maximum (the node's in-order predecessor) back at
+        the node. When the walk reaches the predecessor it follows that
+        temporary "thread" back up, removes it, and continues right.
         
         Args:
-            node: Current node to visit.
+            node: Root of the subtree to visit.
             output: List to append values to.
         
         Note:
             Modifies output in place rather than returning a new list.
             This is more memory efficient for large trees.
+            
+            The tree's right pointers are temporarily rewired while this
+            runs, so the caller MUST hold the WRITE lock for the whole
+            call (a reader sharing the lock would see the threads).
+            Every thread is removed again before the method returns.
         """
-        if node is not None:
-            # Visit left subtree first (smaller values).
-            self._in_order_traversal(node.left, output)
-            # Visit this node (append its value).
-            output.append(node.val)
-            # Visit right subtree (larger values).
-            self._in_order_traversal(node.right, output)
+        append = output.append
+        current = node
+        
+        while current is not None:
+            left = current.left
+            
+            if left is None:
+                # No left subtree: visit this node, then go right
+                # (possibly following a thread back up).
+                append(current.val)
+                current = current.right
+                continue
+            
+            # Find the in-order predecessor: the rightmost node of the
+            # left subtree (stopping if we reach our own thread).
+            pred = left
+            while pred.right is not None and pred.right is not current:
+                pred = pred.right
+            
+            if pred.right is None:
+                # First visit: thread the predecessor back to us and
+                # descend into the left subtree (smaller values).
+                pred.right = current
+                current = left
+            else:
+                # Second visit (came back up the thread): the left subtree
+                # is done. Remove the thread, visit this node, go right.
+                pred.right = None
+                append(current.val)
+                current = current.right
     
     def pre_order_traversal(self) -> List[Any]:
         """
@@ -922,7 +1855,7 @@ class AVLTree:
         
         Time Complexity: O(n)
         """
-        with self._lock:
+        with self._lock.reader:
             result: List[Any] = []
             self._pre_order_traversal(self.root, result)
             return result
@@ -950,7 +1883,7 @@ class AVLTree:
         
         Time Complexity: O(n)
         """
-        with self._lock:
+        with self._lock.reader:
             result: List[Any] = []
             self._post_order_traversal(self.root, result)
             return result
@@ -970,160 +1903,14 @@ class AVLTree:
     # PRIVATE HELPER METHODS - HEIGHT AND BALANCE
     # =========================================================================
     
-    def _get_height(self, node: Optional[AVLNode]) -> int:
-        """
-        Get the height of a node.
-        
-        Args:
-            node: The node to get height of.
-        
-        Returns:
-            The height of the node, or 0 if node is None.
-        
-        Note:
-            None nodes have height 0. Leaf nodes have height 1.
-            This is important for balance factor calculations.
-        """
-        if node is None:
-            return 0
-        return node.height
+    # Heights are read straight off the node as
+    #     0 if node is None else node.height
+    # rather than through a helper method. None nodes have height 0 and
+    # leaf nodes have height 1; a method call per read was the single
+    # largest cost in the rebalancing paths. Balance factors
+    # (left height - right height) are computed the same way, inline.
     
-    def _get_balance_factor(self, node: Optional[AVLNode]) -> int:
-        """
-        Calculate the balance factor of a node.
-        
-        The balance factor is: height(left subtree) - height(right subtree)
-        
-        In a valid AVL tree, balance factor must be -1, 0, or 1.
-        - Positive: left-heavy
-        - Negative: right-heavy
-        - Zero: perfectly balanced
-        
-        Args:
-            node: The node to calculate balance factor for.
-        
-        Returns:
-            The balance factor, or 0 if node is None.
-        """
-        if node is None:
-            return 0
-        return self._get_height(node.left) - self._get_height(node.right)
-    
-    # =========================================================================
-    # PRIVATE HELPER METHODS - ROTATIONS
-    # =========================================================================
-    #
-    # AVL trees maintain balance through four types of rotations:
-    #
-    # 1. Right Rotation (LL case):
-    #    Used when left subtree is too tall and the left child is left-heavy.
-    #
-    #        z                y
-    #       / \              / \
-    #      y   T4    =>    x    z
-    #     / \             / \  / \
-    #    x   T3          T1 T2 T3 T4
-    #   / \
-    #  T1  T2
-    #
-    # 2. Left Rotation (RR case):
-    #    Mirror image of right rotation.
-    #
-    # 3. Left-Right Rotation (LR case):
-    #    First rotate left on left child, then rotate right on node.
-    #
-    # 4. Right-Left Rotation (RL case):
-    #    First rotate right on right child, then rotate left on node.
-    
-    def _rotate_right(self, z: AVLNode) -> AVLNode:
-        """
-        Perform a right rotation around node z.
-        
-        This is used when the left subtree is too tall (LL or LR case).
-        
-        Before rotation:
-                z
-               / \
-              y   T4
-             / \
-            x   T3
-        
-        After rotation:
-                y
-               / \
-              x   z
-                 / \
-                T3  T4
-        
-        Args:
-            z: The node to rotate around (the unbalanced node).
-        
-        Returns:
-            y: The new root of this subtree.
-        
-        Note:
-            - y becomes the new root
-            - z becomes y's right child
-            - y's original right child (T3) becomes z's left child
-            - Heights must be updated: z first, then y
-        """
-        # Store references to the nodes involved.
-        y = z.left         # y is z's left child (will become new root).
-        T3 = y.right       # T3 is y's right subtree (will move to z's left).
-        
-        # Perform the rotation.
-        y.right = z        # z becomes y's right child.
-        z.left = T3        # T3 becomes z's left child.
-        
-        # Update heights BOTTOM-UP (z first, then y).
-        # This is critical: y's height depends on z's new height.
-        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
-        
-        # Return the new root of this subtree.
-        return y
-    
-    def _rotate_left(self, z: AVLNode) -> AVLNode:
-        """
-        Perform a left rotation around node z.
-        
-        This is the mirror image of right rotation.
-        Used when the right subtree is too tall (RR or RL case).
-        
-        Before rotation:
-            z
-           / \
-          T1  y
-             / \
-            T2  x
-        
-        After rotation:
-              y
-             / \
-            z   x
-           / \
-          T1  T2
-        
-        Args:
-            z: The node to rotate around.
-        
-        Returns:
-            y: The new root of this subtree.
-        """
-        y = z.right        # y is z's right child (will become new root).
-        T2 = y.left        # T2 is y's left subtree (will move to z's right).
-        
-        # Perform the rotation.
-        y.left = z         # z becomes y's left child.
-        z.right = T2       # T2 becomes z's right child.
-        
-        # Update heights bottom-up.
-        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
-        
-        return y
-    
-    def _rebalance(self, node: AVLNode) -> AVLNode:
+    def _rebalance(self, node: AVLNode, balance: int) -> AVLNode:
         """
         Rebalance the subtree rooted at 'node' if necessary.
         
@@ -1147,6 +1934,10 @@ class AVLTree:
         
         Args:
             node: The node to potentially rebalance.
+            balance: node's balance factor. The caller (_retrace) has
+                     just read both child heights to update node.height,
+                     so it passes the difference in rather than having
+                     it recomputed here.
         
         Returns:
             The new root of the subtree (same node if no rotation,
@@ -1158,40 +1949,44 @@ class AVLTree:
             This is the correct approach that works for both insertions
             and deletions.
         """
-        # Calculate the balance factor.
-        balance = self._get_balance_factor(node)
-        
         # Check if rebalancing is needed (|balance| > 1).
         
         # CASE: Left-heavy (balance > 1)
         if balance > 1:
             # Determine if it's LL or LR case by checking left child's balance.
-            left_balance = self._get_balance_factor(node.left)
+            # (The left child exists: the left side is at least 2 tall.)
+            child = node.left
+            left_balance = (
+                (0 if child.left is None else child.left.height)
+                - (0 if child.right is None else child.right.height)
+            )
             
             if left_balance >= 0:
                 # LL Case: Left child is left-heavy or balanced.
                 # Single right rotation fixes this.
-                return self._rotate_right(node)
+                return _rotate_right(node)
             else:
                 # LR Case: Left child is right-heavy.
                 # Need double rotation: left-rotate left child, then right-rotate node.
-                node.left = self._rotate_left(node.left)
-                return self._rotate_right(node)
+                return _rotate_left_right(node)
         
         # CASE: Right-heavy (balance < -1)
         if balance < -1:
             # Determine if it's RR or RL case by checking right child's balance.
-            right_balance = self._get_balance_factor(node.right)
+            child = node.right
+            right_balance = (
+                (0 if child.left is None else child.left.height)
+                - (0 if child.right is None else child.right.height)
+            )
             
             if right_balance <= 0:
                 # RR Case: Right child is right-heavy or balanced.
                 # Single left rotation fixes this.
-                return self._rotate_left(node)
+                return _rotate_left(node)
             else:
                 # RL Case: Right child is left-heavy.
                 # Need double rotation: right-rotate right child, then left-rotate node.
-                node.right = self._rotate_right(node.right)
-                return self._rotate_left(node)
+                return _rotate_right_left(node)
         
         # No rebalancing needed; return the node unchanged.
         return node
@@ -1216,9 +2011,10 @@ class AVLTree:
             Assumes node is not None. Caller must check.
         """
         current = node
-        # Keep going left until we can't anymore.
-        while current.left is not None:
-            current = current.left
+        # Keep going left until we can't anymore. The walrus keeps the
+        # child we just tested, so each step loads .left only once.
+        while (left := current.left) is not None:
+            current = left
         return current
     
     def _get_max_node(self, node: AVLNode) -> AVLNode:
@@ -1234,8 +2030,8 @@ class AVLTree:
             The node with the largest value.
         """
         current = node
-        while current.right is not None:
-            current = current.right
+        while (right := current.right) is not None:
+            current = right
         return current
     
     # =========================================================================
@@ -1264,7 +2060,14 @@ class AVLTree:
         """
         Populate the tree from a list of keys.
         
-        This CLEARS the existing tree and inserts all keys from the list.
+        This CLEARS the existing tree and replaces it with the keys from
+        the list. Duplicates are dropped, as with insert().
+        
+        Rather than inserting one key at a time (O(n log n) with a
+        rebalance per insert), the keys are sorted once and the tree is
+        built directly from the sorted list in O(n). Sorting is cheap when
+        the input is already mostly sorted (e.g. a merge of two sorted
+        lists), since Python's sort exploits existing runs.
         
         Args:
             keys: List of values to insert.
@@ -1278,14 +2081,177 @@ class AVLTree:
             >>> tree.from_list([5, 3, 7, 1])
             >>> print(tree.to_list())  # [1, 3, 5, 7]
         """
-        with self._lock:
-            # Clear the existing tree.
-            self.root = None
-            self._size = 0
+        for key in keys:
+            self._validate_key(key)
+        
+        ordered = sorted(keys)
+        
+        with self._lock.writer:
+            self._load_sorted(ordered)
+    
+    @classmethod
+    def from_sorted(cls, keys: Iterable[Any], **kwargs: Any) -> 'AVLTree':
+        """
+        Create a new tree holding the given keys.
         
-        # Insert each key.
+        Intended for bulk loading data that is already in order (a saved
+        to_list() export, a sorted query result, ...). The whole tree is
+        built in one O(n) pass with no rotations, instead of n inserts.
+        Unsorted input still works, it just costs a sort.
+        
+        Args:
+            keys: Values to load, ideally in ascending order.
+            **kwargs: Passed to the AVLTree constructor (max_size, ...).
+        
+        Returns:
+            The new tree.
+        
+        Example:
+            >>> tree = AVLTree.from_sorted([1, 3, 5, 7], max_size=100)
+        """
+        tree = cls(**kwargs)
+        tree.from_list(list(keys))
+        return tree
+    
+    def bulk_insert(self, keys: Iterable[Any]) -> int:
+        """
+        Insert many keys at once.
+        
+        All keys are validated up front and the whole batch runs under one
+        lock acquisition, with no per-key logging. Depending on the batch
+        size relative to the tree, it either:
+        - rebuilds: merges the new keys with the existing ones and builds
+          a fresh balanced tree in one pass (large batches), or
+        - inserts each key in place (small batches), which avoids
+          rebuilding every existing node for a handful of new keys.
+        
+        Args:
+            keys: Values to insert. Duplicates (of each other or of keys
+                  already in the tree) are ignored, as with insert().
+        
+        Returns:
+            The number of keys actually added.
+        
+        Raises:
+            AVLTreeKeyError: If any key is invalid.
+            AVLTreeCapacityError: If the result would exceed max_size.
+                                  The tree is left unchanged.
+            AVLTreeDepthError: If a small batch would exceed max_depth.
+                               The tree is left unchanged.
+        """
+        keys = list(keys)
         for key in keys:
-            self.insert(key)
+            self._validate_key(key)
+        
+        with self._lock.writer:
+            original_size = self._size
+            
+            if len(keys) * _BULK_REBUILD_RATIO <= original_size:
+                self._insert_each(keys)
+                return self._size - original_size
+            
+            # The existing keys form one sorted run, so the sort is
+            # close to linear when the batch is small or itself sorted.
+            merged = self._get_snapshot() + keys
+            merged.sort()
+            
+            self._load_sorted(merged)
+            return self._size - original_size
+    
+    def _insert_each(self, keys: List[Any]) -> None:
+        """
+        Insert keys one at a time, all or nothing.
+        
+        If an insert fails (capacity or depth limit), the keys this call
+        already added are deleted again before the error propagates.
+        
+        Note:
+            This method assumes the lock is already held.
+        """
+        added: List[Any] = []
+        try:
+            for key in keys:
+                if self._size >= self._size_limit:
+                    raise AVLTreeCapacityError(
+                        f"Tree has reached maximum capacity of {self._max_size} nodes"
+                    )
+                if self._insert_iterative(key):
+                    added.append(key)
+        except AVLTreeError:
+            for key in added:
+                self._delete_iterative(key)
+            raise
+    
+    def _load_sorted(self, ordered: List[Any]) -> None:
+        """
+        Replace the tree's contents with the given sorted keys.
+        
+        Args:
+            ordered: Keys in ascending order; duplicates are dropped.
+        
+        Raises:
+            AVLTreeCapacityError: If there are more than max_size unique
+                                  keys (the tree is left unchanged).
+        
+        Note:
+            This method assumes the lock is already held.
+        """
+        # Drop duplicates so the build below sees strictly increasing keys.
+        unique = [
+            key for i, key in enumerate(ordered)
+            if i == 0 or ordered[i - 1] < key
+        ]
+        
+        if len(unique) > self._size_limit:
+            raise AVLTreeCapacityError(
+                f"Tree has reached maximum capacity of {self._max_size} nodes"
+            )
+        
+        self.root = self._build_balanced(unique, 0, len(unique))
+        self._size = len(unique)
+        # The sorted keys ARE the snapshot.
+        self._snapshot = unique
+        self._min_val = unique[0] if unique else None
+        self._max_val = unique[-1] if unique else None
+        
+        if self._enable_logging:
+            logger.info(f"Built AVL tree from {self._size} keys")
+    
+    def _build_balanced(
+        self,
+        keys: List[Any],
+        lo: int,
+        hi: int
+    ) -> Optional[AVLNode]:
+        """
+        Build a height-balanced subtree from sorted keys[lo:hi].
+        
+        The middle key becomes the root, so the two halves differ in size
+        by at most one and every node satisfies the AVL balance rule
+        without any rotations. Recursion depth is O(log n).
+        
+        Heights are known without looking at the children: splitting at
+        the middle makes a slice of m keys exactly m.bit_length() levels
+        tall (1 key -> 1, 2-3 keys -> 2, 4-7 keys -> 3, ...).
+        
+        Args:
+            keys: Strictly increasing list of keys.
+            lo: First index (inclusive) of the slice to build.
+            hi: Last index (exclusive) of the slice to build.
+        
+        Returns:
+            The root of the new subtree, or None for an empty slice.
+        """
+        if lo >= hi:
+            return None
+        
+        mid = (lo + hi) // 2
+        node = AVLNode(keys[mid])
+        node.left = self._build_balanced(keys, lo, mid)
+        node.right = self._build_balanced(keys, mid + 1, hi)
+        node.height = (hi - lo).bit_length()
+        node.size = hi - lo
+        return node
     
     # =========================================================================
     # PUBLIC METHODS - UTILITY
@@ -1300,9 +2266,11 @@ class AVLTree:
         Thread Safety:
             Acquires the lock for the operation.
         """
-        with self._lock:
+        with self._lock.writer:
             self.root = None
             self._size = 0
+            self._snapshot = None
+            self._min_val = self._max_val = None
             
             if self._enable_logging:
                 logger.info("Cleared AVL tree")
@@ -1314,12 +2282,13 @@ class AVLTree:
         Returns:
             The smallest value, or None if tree is empty.
         
-        Time Complexity: O(log n)
+        Thread Safety:
+            Reads one attribute that writers replace in a single store,
+            so no lock is needed.
+        
+        Time Complexity: O(1) (cached; see _min_val in __init__)
         """
-        with self._lock:
-            if self.root is None:
-                return None
-            return self._get_min_node(self.root).val
+        return self._min_val
     
     def get_max(self) -> Optional[Any]:
         """
@@ -1328,12 +2297,61 @@ class AVLTree:
         Returns:
             The largest value, or None if tree is empty.
         
-        Time Complexity: O(log n)
+        Thread Safety:
+            Reads one attribute that writers replace in a single store,
+            so no lock is needed.
+        
+        Time Complexity: O(1) (cached; see _max_val in __init__)
+        """
+        return self._max_val
+    
+    def _read_optimistic(self, read: Callable[..., Any], *args: Any) -> Any:
         """
-        with self._lock:
-            if self.root is None:
-                return None
-            return self._get_max_node(self.root).val
+        Run a short read-only function, without the lock if possible.
+        
+        Optimistic read (a "seqlock"):
+        1. Note the lock's version. If it's odd a writer is active, so
+           go straight to step 4.
+        2. Run read(*args) with NO lock held.
+        3. If the version is unchanged, no writer touched the tree while
+           we looked, so the result is exactly what a locked read would
+           have returned. Done.
+        4. Otherwise run read(*args) again under the read lock.
+        
+        A read that races with a writer can see a half-rotated tree or a
+        recycled node (even a None value) and fail or return nonsense.
+        Any such result is thrown away by the version check, and any
+        exception just sends us to the locked retry, which raises it
+        again if it's genuine (e.g. an uncomparable key).
+        
+        Args:
+            read: Function that reads the tree (assuming no writer) and
+                  returns the answer. It must not modify anything.
+            *args: Arguments passed to read.
+        
+        Returns:
+            Whatever read returns.
+        
+        Why:
+            search() and 'in' are the hot read paths. Skipping the lock
+            saves the two Condition round trips of the readers-writer
+            lock on every call when no insert or delete is running,
+            which is nearly always.
+        """
+        lock = self._lock
+        version = lock.version
+        
+        if not version & 1:
+            try:
+                result = read(*args)
+            except Exception:
+                pass  # Probably raced a writer; retry under the lock.
+            else:
+                if lock.version == version:
+                    return result
+        
+        with lock.reader:
+            return read(*args)
     
     def is_valid_avl(self) -> bool:
         """
@@ -1349,83 +2367,156 @@ class AVLTree:
         Returns:
             True if the tree is valid, False otherwise.
         
-        Time Complexity: O(n)
+        Time Complexity: O(n), but a tree whose height is impossible for
+        its size is rejected in O(1) by _quick_validate first.
         """
-        with self._lock:
-            return self._validate_avl(self.root, float('-inf'), float('inf'))
+        with self._lock.reader:
+            return self._quick_validate() and self._validate_avl(self.root)
     
-    def _validate_avl(
-        self,
-        node: Optional[AVLNode],
-        min_val: Any,
-        max_val: Any
-    ) -> bool:
+    def _quick_validate(self) -> bool:
         """
-        Recursively validate AVL properties.
+        O(1) sanity check of the tree's shape.
+        
+        An AVL tree with n nodes is never taller than about
+        1.44 * log2(n + 2) (the sparsest AVL trees are Fibonacci trees),
+        so a taller root means something is broken. Also checks that the
+        root and the node count agree about whether the tree is empty.
+        
+        Passing this check does NOT prove the tree is valid; it only
+        catches gross corruption cheaply. Use _validate_avl for the full
+        check. (The root's subtree size must also equal the node count.)
+        
+        Returns:
+            False if the tree is definitely invalid, True otherwise.
+        
+        Note:
+            This method assumes the lock is already held.
+        """
+        root = self.root
+        if root is None:
+            return self._size == 0
+        if root.size != self._size:
+            return False
+        return root.height <= 1.4405 * math.log2(self._size + 2)
+    
+    def _validate_avl(self, root: Optional[AVLNode]) -> bool:
+        """
+        Validate AVL properties without recursion.
+        
+        Walks the tree with an explicit stack of (node, low, high) entries,
+        where low/high are the exclusive bounds the node's value must fall
+        between (None means unbounded on that side). Stops at the first
+        violation.
+        
+        Each node's stored height and size are checked against its
+        children's stored values. Since every node is checked, that
+        verifies all heights and sizes bottom-up without a separate pass.
         
         Args:
-            node: Current node to validate.
-            min_val: Minimum allowed value (exclusive).
-            max_val: Maximum allowed value (exclusive).
+            root: Root of the subtree to validate.
         
         Returns:
             True if subtree is valid, False otherwise.
+        
+        Note:
+            Bounds use None rather than float('-inf')/float('inf') so that
+            keys which can't be compared with floats (tuples, strings)
+            validate too. Only the < operator is used, as elsewhere.
         """
-        if node is None:
+        if root is None:
             return True
         
-        # Check BST property.
-        if node.val <= min_val or node.val >= max_val:
-            return False
+        stack = [(root, None, None)]
+        pop = stack.pop
+        push = stack.append
         
-        # Check AVL balance property.
-        balance = self._get_balance_factor(node)
-        if abs(balance) > 1:
-            return False
-        
-        # Check height is correctly calculated.
-        expected_height = 1 + max(
-            self._get_height(node.left),
-            self._get_height(node.right)
-        )
-        if node.height != expected_height:
-            return False
+        while stack:
+            node, low, high = pop()
+            val = node.val
+            
+            # Check BST property: low < val < high.
+            if low is not None and not low < val:
+                return False
+            if high is not None and not val < high:
+                return False
+            
+            left = node.left
+            right = node.right
+            lh = 0 if left is None else left.height
+            rh = 0 if right is None else right.height
+            
+            # Check AVL balance property.
+            if lh - rh > 1 or rh - lh > 1:
+                return False
+            
+            # Check height is correctly calculated.
+            if node.height != 1 + (lh if lh > rh else rh):
+                return False
+            
+            # Check subtree size is correctly calculated.
+            if node.size != (
+                1 + (0 if left is None else left.size)
+                + (0 if right is None else right.size)
+            ):
+                return False
+            
+            # Validate children with narrowed bounds.
+            if left is not None:
+                push((left, low, val))
+            if right is not None:
+                push((right, val, high))
         
-        # Recursively validate children.
-        return (
-            self._validate_avl(node.left, min_val, node.val) and
-            self._validate_avl(node.right, node.val, max_val)
-        )
+        return True
     
     def print_tree(self) -> None:
         """
         Print a visual representation of the tree.
         
         Useful for debugging. Shows tree structure with proper indentation.
+        
+        The lines are built under the lock and printed after releasing it,
+        so slow console output never holds up writers.
         """
-        with self._lock:
-            if self.root is None:
-                print("(empty tree)")
-                return
-            self._print_tree_recursive(self.root, "", True)
+        with self._lock.reader:
+            lines = self._format_tree()
+        
+        print("\n".join(lines) if lines else "(empty tree)")
     
-    def _print_tree_recursive(
-        self,
-        node: Optional[AVLNode],
-        prefix: str,
-        is_last: bool
-    ) -> None:
-        """Recursively print tree with visual formatting."""
-        if node is not None:
-            print(prefix + ("└── " if is_last else "├── ") + str(node.val))
+    def _format_tree(self) -> List[str]:
+        """
+        Build the lines printed by print_tree(), without recursion.
+        
+        Each node is one line. Its right child is listed before its left
+        child (so the larger values appear on top), and children are
+        indented under their parent with box-drawing connectors.
+        
+        An explicit stack of (node, prefix, is_last) entries replaces the
+        call stack, so tall trees can't hit the recursion limit. The left
+        child is pushed first so that the right child is popped first.
+        
+        Note:
+            This method assumes the lock is already held.
+        """
+        lines: List[str] = []
+        if self.root is None:
+            return lines
+        
+        stack = [(self.root, "", True)]
+        
+        while stack:
+            node, prefix, is_last = stack.pop()
+            if node is None:
+                continue
+            
+            lines.append(prefix + ("└── " if is_last else "├── ") + str(node.val))
             new_prefix = prefix + ("    " if is_last else "│   ")
             
-            # Print right child first (appears on top visually).
-            if node.right or node.left:
-                self._print_tree_recursive(node.right, new_prefix, node.left is None)
             if node.left:
-                self._print_tree_recursive(node.left, new_prefix, True)
-
+                stack.append((node.left, new_prefix, True))
+            if node.right or node.left:
+                stack.append((node.right, new_prefix, node.left is None))
+        
+        return lines
 
 # =============================================================================
 # EXAMPLE USAGE AND TESTING
@@ -0,0 +1,678 @@
+"""
+B+ Tree - Cache-Friendly Alternative to the AVL Tree
+=====================================================
+
+This module provides a thread-safe B+ tree that shares AVLTree's container
+API (insert/delete/search, in-order traversal, min/max, bulk loading).
+It does not implement the order-statistic queries the score tracker
+relies on (rank, select, nlargest, nsmallest) or AVLTree's debugging
+helpers, so it is not a replacement for AVLTree behind the tracker.
+
+Author: Joe (Simply Works AI)
+
+Why a B+ tree:
+    An AVL node holds ONE key, so every comparison during a search is a
+    pointer chase to a new object somewhere else in memory, and a tree of
+    n keys is ~1.44*log2(n) levels deep. A B+ tree node holds up to
+    'order' keys in a plain Python list:
+        - The tree is only log_order(n) levels deep (3 levels hold
+          ~30,000 keys at the default order of 32)
+        - Within a node, the right key/child is found with the bisect
+          module, which does its comparisons in C
+        - All keys live in the leaves, and the leaves are linked left to
+          right, so sorted iteration is just concatenating leaf lists
+
+Functional Features:
+    - O(log n) insert, delete, and search operations
+    - Same method names and exceptions as AVLTree
+    - Iteration protocol support (__iter__, __contains__, __len__)
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import threading
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Optional, Any, List, Iterator, Iterable
+
+# The B+ tree raises the same exceptions as the AVL tree, so callers that
+# catch AVLTreeError work with either implementation.
+from avl_tree_production import AVLTreeCapacityError, AVLTreeKeyError
+
+
+logger = logging.getLogger(__name__)
+
+# Built-in key types that are always comparable (see AVLTree._validate_key)
+_TRUSTED_KEY_TYPES = frozenset({int, float, str, bytes})
+
+
+# =============================================================================
+# B+ TREE NODE CLASS
+# =============================================================================
+
+class BPlusNode:
+    """
+    A single node in the B+ tree.
+    
+    Leaf nodes:
+        keys: The stored values, sorted ascending.
+        children: None.
+        next_leaf: The leaf holding the next-larger keys (or None).
+    
+    Internal nodes:
+        keys: Separator keys, sorted ascending.
+        children: len(keys) + 1 child nodes. Every key under children[i]
+                  is < keys[i], and every key under children[i + 1] is
+                  >= keys[i].
+        next_leaf: Unused (None).
+    """
+    
+    __slots__ = ('keys', 'children', 'is_leaf', 'next_leaf')
+    
+    def __init__(
+        self,
+        keys: List[Any],
+        children: Optional[List['BPlusNode']] = None
+    ) -> None:
+        self.keys = keys
+        self.children = children
+        self.is_leaf = children is None
+        self.next_leaf: Optional['BPlusNode'] = None
+    
+    def __repr__(self) -> str:
+        kind = "leaf" if self.is_leaf else "internal"
+        return f"BPlusNode({kind}, {len(self.keys)} keys)"
+
+
+# =============================================================================
+# B+ TREE CLASS
+# =============================================================================
+
+class BPlusTree:
+    """
+    A thread-safe B+ tree implementation with resource limits.
+    
+    Covers AVLTree's container API: insert/delete/search, in-order
+    traversal, min/max, serialization and the container protocol behave
+    the same. search() returns the stored key rather than a node, since
+    keys are not held in individual node objects.
+    
+    Not provided: rank(), select(), nlargest(), nsmallest(),
+    pre_order_traversal(), post_order_traversal(), is_valid_avl() and
+    print_tree().
+    
+    Thread Safety:
+        All public methods acquire a (non-reentrant) lock before reading
+        or modifying the tree. Iteration works on a snapshot, as in
+        AVLTree.
+    
+    Example:
+        >>> tree = BPlusTree(max_size=10000)
+        >>> tree.insert(5)
+        >>> tree.insert(3)
+        >>> 3 in tree  # True
+        >>> list(tree)  # [3, 5]
+    """
+    
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        order: int = 32,
+        enable_logging: bool = False,
+        validate_keys: bool = True
+    ) -> None:
+        """
+        Initialize an empty B+ tree.
+        
+        Args:
+            max_size: Maximum number of keys allowed in the tree.
+                      If None, no limit is enforced.
+            order: Maximum number of keys per node (fan-out - 1). Nodes
+                   split when they grow past this and are refilled or
+                   merged when they drop below half of it. Must be >= 4.
+            enable_logging: If True, log insert/delete operations.
+            validate_keys: If False, only reject None keys (see AVLTree).
+        
+        Raises:
+            ValueError: If order is less than 4.
+        """
+        if order < 4:
+            raise ValueError("order must be at least 4")
+        
+        # The tree always has a root; an empty tree is one empty leaf.
+        self.root: BPlusNode = BPlusNode([])
+        self._size: int = 0
+        
+        self._max_size: Optional[int] = max_size
+        self._size_limit: float = float('inf') if max_size is None else max_size
+        
+        # Split above _order keys, rebalance below _min_keys.
+        self._order: int = order
+        self._min_keys: int = order // 2
+        
+        self._enable_logging: bool = enable_logging
+        self._validate_keys: bool = validate_keys
+        
+        self._lock: threading.Lock = threading.Lock()
+    
+    # =========================================================================
+    # PYTHON MAGIC METHODS
+    # =========================================================================
+    
+    def __len__(self) -> int:
+        """Return the number of keys in the tree. O(1)."""
+        with self._lock:
+            return self._size
+    
+    def __contains__(self, key: Any) -> bool:
+        """Check if a key exists in the tree. O(log n)."""
+        with self._lock:
+            return self._search_unlocked(key) is not None
+    
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over all keys in sorted order.
+        
+        Like AVLTree, this takes a snapshot under the lock and yields from
+        it outside the lock, so the loop body may modify the tree.
+        """
+        with self._lock:
+            snapshot = self._in_order_unlocked()
+        
+        for value in snapshot:
+            yield value
+    
+    def __repr__(self) -> str:
+        with self._lock:
+            return (
+                f"BPlusTree(size={self._size}, order={self._order}, "
+                f"max_size={self._max_size})"
+            )
+    
+    # =========================================================================
+    # PUBLIC PROPERTIES
+    # =========================================================================
+    
+    @property
+    def size(self) -> int:
+        """Get the current number of keys in the tree."""
+        with self._lock:
+            return self._size
+    
+    @property
+    def height(self) -> int:
+        """Get the number of levels in the tree, or 0 if empty."""
+        with self._lock:
+            if self._size == 0:
+                return 0
+            levels = 1
+            node = self.root
+            while not node.is_leaf:
+                node = node.children[0]
+                levels += 1
+            return levels
+    
+    @property
+    def is_empty(self) -> bool:
+        """Check if the tree is empty."""
+        with self._lock:
+            return self._size == 0
+    
+    # =========================================================================
+    # INPUT VALIDATION
+    # =========================================================================
+    
+    def _validate_key(self, key: Any) -> None:
+        """
+        Validate that a key can be used in the tree.
+        
+        Same rules as AVLTree._validate_key: None is rejected, and keys
+        that are not plain built-in scalars must support <.
+        
+        Raises:
+            AVLTreeKeyError: If the key is None or not comparable.
+        """
+        if key is None:
+            raise AVLTreeKeyError("Key cannot be None")
+        
+        if not self._validate_keys or type(key) in _TRUSTED_KEY_TYPES:
+            return
+        
+        try:
+            _ = key < key
+        except TypeError as e:
+            raise AVLTreeKeyError(
+                f"Key must be comparable (support the < operator): {e}"
+            )
+    
+    # =========================================================================
+    # PUBLIC METHODS - INSERT
+    # =========================================================================
+    
+    def insert(self, key: Any) -> bool:
+        """
+        Insert a key into the tree.
+        
+        Args:
+            key: The value to insert.
+        
+        Returns:
+            True if the key was inserted, False if it was a duplicate.
+        
+        Raises:
+            AVLTreeKeyError: If the key is None or not comparable.
+            AVLTreeCapacityError: If the tree has reached max_size.
+        
+        Time Complexity: O(log n)
+        """
+        self._validate_key(key)
+        
+        with self._lock:
+            if self._size >= self._size_limit:
+                raise AVLTreeCapacityError(
+                    f"Tree has reached maximum capacity of {self._max_size} nodes"
+                )
+            
+            inserted = self._insert_unlocked(key)
+            
+            if self._enable_logging:
+                if inserted:
+                    logger.info(f"Inserted key {key} into B+ tree")
+                else:
+                    logger.debug(f"Duplicate key {key} not inserted")
+            
+            return inserted
+    
+    def _insert_unlocked(self, key: Any) -> bool:
+        """
+        Insert a key; the caller must hold the lock.
+        
+        Walks down to the leaf, inserts there, then splits any node that
+        overflowed, pushing a separator into its parent. Splits can ripple
+        up to the root, which is how the tree grows taller.
+        """
+        # WALK DOWN, remembering (node, child index) at each level.
+        path = []
+        node = self.root
+        while not node.is_leaf:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        
+        # INSERT into the leaf (sorted position, no duplicates).
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return False
+        keys.insert(i, key)
+        self._size += 1
+        
+        if len(keys) <= self._order:
+            return True
+        
+        # SPLIT the overflowing leaf. The right half's first key is copied
+        # up as the separator (leaf keys stay in the leaves).
+        mid = len(keys) // 2
+        right = BPlusNode(keys[mid:])
+        del keys[mid:]
+        right.next_leaf = node.next_leaf
+        node.next_leaf = right
+        separator = right.keys[0]
+        
+        # PROPAGATE the split upward.
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+            
+            if len(parent.keys) <= self._order:
+                return True
+            
+            # Split the internal node. The middle separator MOVES up
+            # (internal separators are not repeated in either half).
+            pkeys = parent.keys
+            mid = len(pkeys) // 2
+            separator = pkeys[mid]
+            right = BPlusNode(pkeys[mid + 1:], parent.children[mid + 1:])
+            del pkeys[mid:]
+            del parent.children[mid + 1:]
+        
+        # The root itself split: grow a new root above the two halves.
+        self.root = BPlusNode([separator], [self.root, right])
+        return True
+    
+    # =========================================================================
+    # PUBLIC METHODS - DELETE
+    # =========================================================================
+    
+    def delete(self, key: Any) -> bool:
+        """
+        Delete a key from the tree.
+        
+        Args:
+            key: The value to delete.
+        
+        Returns:
+            True if the key was found and deleted, False if not found.
+        
+        Raises:
+            AVLTreeKeyError: If the key is None or not comparable.
+        
+        Time Complexity: O(log n)
+        """
+        self._validate_key(key)
+        
+        with self._lock:
+            deleted = self._delete_unlocked(key)
+            
+            if self._enable_logging:
+                if deleted:
+                    logger.info(f"Deleted key {key} from B+ tree")
+                else:
+                    logger.debug(f"Key {key} not found for deletion")
+            
+            return deleted
+    
+    def _delete_unlocked(self, key: Any) -> bool:
+        """
+        Delete a key; the caller must hold the lock.
+        
+        After removing the key from its leaf, any node left with fewer
+        than _min_keys keys is fixed bottom-up by either borrowing one
+        key from a sibling or merging with it. A merge removes a
+        separator from the parent, which may in turn underflow.
+        """
+        path = []
+        node = self.root
+        while not node.is_leaf:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return False
+        del keys[i]
+        self._size -= 1
+        
+        min_keys = self._min_keys
+        while path and len(node.keys) < min_keys:
+            parent, i = path.pop()
+            siblings = parent.children
+            
+            # BORROW from the left sibling if it can spare a key.
+            if i > 0 and len(siblings[i - 1].keys) > min_keys:
+                left = siblings[i - 1]
+                if node.is_leaf:
+                    node.keys.insert(0, left.keys.pop())
+                    parent.keys[i - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[i - 1])
+                    parent.keys[i - 1] = left.keys.pop()
+                    node.children.insert(0, left.children.pop())
+                break
+            
+            # BORROW from the right sibling if it can spare a key.
+            if i + 1 < len(siblings) and len(siblings[i + 1].keys) > min_keys:
+                right = siblings[i + 1]
+                if node.is_leaf:
+                    node.keys.append(right.keys.pop(0))
+                    parent.keys[i] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[i])
+                    parent.keys[i] = right.keys.pop(0)
+                    node.children.append(right.children.pop(0))
+                break
+            
+            # MERGE with a sibling (both are at minimum size, so the
+            # result fits in one node). Always merge right into left.
+            if i > 0:
+                left, right, sep = siblings[i - 1], node, i - 1
+            else:
+                left, right, sep = node, siblings[i + 1], i
+            
+            if left.is_leaf:
+                left.keys.extend(right.keys)
+                left.next_leaf = right.next_leaf
+            else:
+                left.keys.append(parent.keys[sep])
+                left.keys.extend(right.keys)
+                left.children.extend(right.children)
+            
+            del parent.keys[sep]
+            del siblings[sep + 1]
+            
+            # The parent lost a key; check it on the next iteration.
+            node = parent
+        
+        # A root left with no separators has a single child: drop a level.
+        root = self.root
+        if not root.is_leaf and not root.keys:
+            self.root = root.children[0]
+        
+        return True
+    
+    # =========================================================================
+    # PUBLIC METHODS - SEARCH
+    # =========================================================================
+    
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Search for a key in the tree.
+        
+        Args:
+            key: The value to search for.
+        
+        Returns:
+            The stored key equal to 'key', or None if not found.
+        
+        Raises:
+            AVLTreeKeyError: If the key is None or not comparable.
+        """
+        self._validate_key(key)
+        
+        with self._lock:
+            return self._search_unlocked(key)
+    
+    def _search_unlocked(self, key: Any) -> Optional[Any]:
+        """Search for a key; the caller must hold the lock."""
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[bisect_right(node.keys, key)]
+        
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return keys[i]
+        return None
+    
+    # =========================================================================
+    # PUBLIC METHODS - TRAVERSAL
+    # =========================================================================
+    
+    def in_order_traversal(self) -> List[Any]:
+        """Return all keys in ascending order. O(n)."""
+        with self._lock:
+            return self._in_order_unlocked()
+    
+    def _in_order_unlocked(self) -> List[Any]:
+        """
+        Collect all keys by walking the leaf chain; caller holds the lock.
+        
+        Each leaf contributes its whole key list in one extend(), so this
+        is a handful of C-level copies rather than a per-key visit.
+        """
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[0]
+        
+        result: List[Any] = []
+        while node is not None:
+            result.extend(node.keys)
+            node = node.next_leaf
+        return result
+    
+    # =========================================================================
+    # PUBLIC METHODS - SERIALIZATION
+    # =========================================================================
+    
+    def to_list(self) -> List[Any]:
+        """Export the tree as a sorted list."""
+        return self.in_order_traversal()
+    
+    def from_list(self, keys: List[Any]) -> None:
+        """
+        Replace the tree's contents with the keys from the list.
+        
+        The keys are sorted and de-duplicated, then packed into evenly
+        filled leaves and index levels built bottom-up in O(n), without
+        any splits.
+        
+        Raises:
+            AVLTreeKeyError: If any key is invalid.
+            AVLTreeCapacityError: If list exceeds max_size.
+        """
+        for key in keys:
+            self._validate_key(key)
+        
+        ordered = sorted(keys)
+        
+        with self._lock:
+            self._load_sorted(ordered)
+    
+    @classmethod
+    def from_sorted(cls, keys: Iterable[Any], **kwargs: Any) -> 'BPlusTree':
+        """
+        Create a new tree holding the given keys (see AVLTree.from_sorted).
+        
+        Args:
+            keys: Values to load, ideally in ascending order.
+            **kwargs: Passed to the BPlusTree constructor.
+        """
+        tree = cls(**kwargs)
+        tree.from_list(list(keys))
+        return tree
+    
+    def bulk_insert(self, keys: Iterable[Any]) -> int:
+        """
+        Insert many keys at once with a single rebuild.
+        
+        Returns:
+            The number of keys actually added.
+        
+        Raises:
+            AVLTreeKeyError: If any key is invalid.
+            AVLTreeCapacityError: If the result would exceed max_size.
+                                  The tree is left unchanged.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        
+        with self._lock:
+            original_size = self._size
+            
+            merged = self._in_order_unlocked()
+            merged.extend(keys)
+            merged.sort()
+            
+            self._load_sorted(merged)
+            return self._size - original_size
+    
+    def _load_sorted(self, ordered: List[Any]) -> None:
+        """
+        Replace the tree's contents with the given sorted keys; the caller
+        must hold the lock. Duplicates are dropped.
+        
+        Raises:
+            AVLTreeCapacityError: If there are more than max_size unique
+                                  keys (the tree is left unchanged).
+        """
+        unique = [
+            key for i, key in enumerate(ordered)
+            if i == 0 or ordered[i - 1] < key
+        ]
+        
+        if len(unique) > self._size_limit:
+            raise AVLTreeCapacityError(
+                f"Tree has reached maximum capacity of {self._max_size} nodes"
+            )
+        
+        # Build the leaves, chained left to right. Each level is a list of
+        # (node, smallest key under it) pairs.
+        level = []
+        previous = None
+        for chunk in self._even_chunks(unique, self._order):
+            leaf = BPlusNode(chunk)
+            if previous is not None:
+                previous.next_leaf = leaf
+            previous = leaf
+            level.append((leaf, chunk[0]))
+        
+        # Build index levels until a single root remains. An internal
+        # node holds up to order + 1 children.
+        while len(level) > 1:
+            next_level = []
+            for group in self._even_chunks(level, self._order + 1):
+                node = BPlusNode(
+                    [low for _, low in group[1:]],
+                    [child for child, _ in group]
+                )
+                next_level.append((node, group[0][1]))
+            level = next_level
+        
+        self.root = level[0][0] if level else BPlusNode([])
+        self._size = len(unique)
+        
+        if self._enable_logging:
+            logger.info(f"Built B+ tree from {self._size} keys")
+    
+    @staticmethod
+    def _even_chunks(items: List[Any], capacity: int) -> List[List[Any]]:
+        """
+        Split items into the fewest chunks of at most 'capacity' items,
+        with sizes differing by at most one (so none falls below half).
+        """
+        if not items:
+            return []
+        count = -(-len(items) // capacity)  # ceil division
+        base, extra = divmod(len(items), count)
+        chunks = []
+        start = 0
+        for i in range(count):
+            end = start + base + (1 if i < extra else 0)
+            chunks.append(items[start:end])
+            start = end
+        return chunks
+    
+    # =========================================================================
+    # PUBLIC METHODS - UTILITY
+    # =========================================================================
+    
+    def clear(self) -> None:
+        """Remove all keys from the tree."""
+        with self._lock:
+            self.root = BPlusNode([])
+            self._size = 0
+            
+            if self._enable_logging:
+                logger.info("Cleared B+ tree")
+    
+    def get_min(self) -> Optional[Any]:
+        """Get the minimum key in the tree, or None if empty. O(log n)."""
+        with self._lock:
+            node = self.root
+            while not node.is_leaf:
+                node = node.children[0]
+            return node.keys[0] if node.keys else None
+    
+    def get_max(self) -> Optional[Any]:
+        """Get the maximum key in the tree, or None if empty. O(log n)."""
+        with self._lock:
+            node = self.root
+            while not node.is_leaf:
+                node = node.children[-1]
+            return node.keys[-1] if node.keys else None
@@ -17,8 +17,11 @@ Features:
     - Historical score tracking
 """
 
+from bisect import bisect_left, bisect_right
+import heapq
+from fractions import Fraction
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Iterable
 from dataclasses import dataclass, field
 from avl_tree_production import AVLTree, AVLTreeError
 
@@ -27,11 +30,16 @@ from avl_tree_production import AVLTree, AVLTreeError
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class CandidateScore:
     """
     Represents a single candidate's assessment score.
     
+    Records are immutable once created and use __slots__, so each of the
+    (up to max_candidates) instances skips a per-object __dict__ and
+    attribute reads are fixed-offset loads. eq=False keeps the score-based
+    comparison dunders below instead of a generated field-wise __eq__.
+    
     Attributes:
         candidate_id: Unique identifier for the candidate
         name: Candidate's full name
@@ -39,6 +47,8 @@ class CandidateScore:
         domain_scores: Breakdown by domain (mechanical, electrical, etc.)
         timestamp: When the assessment was completed
         passed: Whether the candidate met the minimum threshold
+        timestamp_iso: timestamp.isoformat(), formatted once at creation
+                       since it is serialized on every save and response
     """
     candidate_id: str
     name: str
@@ -46,15 +56,26 @@ class CandidateScore:
     domain_scores: Dict[str, float] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
     passed: bool = False
+    timestamp_iso: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Frozen, so bypass the generated __setattr__ for the derived field
+        object.__setattr__(self, "timestamp_iso", self.timestamp.isoformat())
     
     def __lt__(self, other):
-        """Enable comparison by score for AVL tree storage."""
+        """
+        Order records by score.
+        
+        The tracker's trees don't use this: they are keyed by plain
+        (score, candidate_id) tuples, which compare in C and keep equal
+        scores distinct. These dunders are for callers sorting records.
+        """
         if isinstance(other, CandidateScore):
             return self.score < other.score
         return self.score < other
     
     def __gt__(self, other):
-        """Enable comparison by score for AVL tree storage."""
+        """Order records by score (see __lt__)."""
         if isinstance(other, CandidateScore):
             return self.score > other.score
         return self.score > other
@@ -69,7 +90,7 @@ class CandidateScore:
         return f"CandidateScore({self.name}, {self.score:.1f}%)"
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainAnalysis:
     """Analysis results for a specific assessment domain."""
     domain: str
@@ -104,14 +125,17 @@ class CandidateScoreTracker:
     """
     
     # Assessment domains matching your 145-question assessment
-    DOMAINS = [
+    DOMAINS = (
         "mechanical",
         "electrical", 
         "hydraulics",
         "plcs",
         "safety",
         "troubleshooting"
-    ]
+    )
+    
+    # Dashboard page sizes whose top-N lists are kept up to date on insert
+    TOP_K_SIZES = (10, 50, 100)
     
     def __init__(
         self,
@@ -129,16 +153,53 @@ class CandidateScoreTracker:
         self.max_candidates = max_candidates
         
         # AVL tree for score-based operations (stores scores as keys)
-        self._score_tree = AVLTree(max_size=max_candidates)
+        # Keys are (score, id) tuples built here, so the trees can skip
+        # their generic per-operation key validation.
+        self._score_tree = AVLTree(max_size=max_candidates, validate_keys=False)
         
         # Dictionary for O(1) lookup by candidate ID
         self._candidates: Dict[str, CandidateScore] = {}
         
         # Domain-specific trees for filtering by domain performance
         self._domain_trees: Dict[str, AVLTree] = {
-            domain: AVLTree(max_size=max_candidates)
+            domain: AVLTree(max_size=max_candidates, validate_keys=False)
             for domain in self.DOMAINS
         }
+        
+        # Bumped on every add/remove so callers can key caches on it
+        self._version = 0
+        
+        # Sorted (score, id) array + id -> rank map + sorted bare scores,
+        # valid for the version recorded alongside it (see _get_ranking)
+        self._ranking: Tuple[
+            List[Tuple[float, str]], Dict[str, int], List[float]
+        ] = ([], {}, [])
+        self._ranking_version = 0
+        
+        # Running totals of the overall and per-domain scores, updated by
+        # every add/remove so averages never need a pass over the scores
+        # (counts, min/max, medians and threshold counts come from the
+        # trees in O(log n); see get_statistics). Kept as exact Fractions:
+        # float totals would drift under repeated add/subtract.
+        self._score_sum = Fraction(0)
+        self._domain_sums: Dict[str, Fraction] = dict.fromkeys(
+            self.DOMAINS, Fraction(0)
+        )
+        
+        # Running histogram of overall scores by whole point: index i counts
+        # scores in [i, i + 1), with index 100 holding exactly 100. Any
+        # bucket size is then a slice sum (see get_score_distribution).
+        self._score_counts: List[int] = [0] * 101
+        
+        # K -> min-heap of the K highest (score, id) keys, for K in
+        # TOP_K_SIZES. Filled lazily, then maintained by add_candidate so
+        # top-N reads between submits don't force a full ranking rebuild.
+        self._top_k: Dict[int, List[Tuple[float, str]]] = {}
+        
+        # Last rendered text report and the (version, passing_threshold)
+        # it was rendered for (see generate_report)
+        self._report: Optional[str] = None
+        self._report_key: Optional[Tuple[int, float]] = None
     
     # =========================================================================
     # CANDIDATE MANAGEMENT
@@ -184,18 +245,119 @@ class CandidateScoreTracker:
         # Add to score tree for ranking operations
         # We use a tuple (score, id) to handle duplicate scores
         self._score_tree.insert((overall_score, candidate_id))
-        
-        # Add to domain trees
-        for domain, score in domain_scores.items():
-            if domain in self._domain_trees:
-                self._domain_trees[domain].insert((score, candidate_id))
+        self._score_sum += Fraction(overall_score)
+        self._count_score(overall_score, 1)
+        
+        # Add to domain trees (keys outside DOMAINS are kept on the
+        # candidate but not tracked)
+        for domain, tree in self._domain_trees.items():
+            score = domain_scores.get(domain)
+            if score is not None:
+                tree.insert((score, candidate_id))
+                self._domain_sums[domain] += Fraction(score)
+        
+        # Bump before touching the top-K heaps: a reader that seeds a heap
+        # from a tree read missing this key re-checks the version after
+        # storing it, so either it drops the heap or the loop below sees it
+        self._version += 1
+        
+        # Keep cached top-K lists current (a heap seeded after the insert
+        # may already hold the key)
+        key = (overall_score, candidate_id)
+        for k, heap in list(self._top_k.items()):
+            if key in heap:
+                continue
+            if len(heap) < k:
+                heapq.heappush(heap, key)
+            else:
+                heapq.heappushpop(heap, key)
         
         return candidate
     
+    def bulk_add(
+        self,
+        records: Iterable[Tuple[str, str, float, Dict[str, float]]]
+    ) -> List[CandidateScore]:
+        """
+        Add many candidates at once.
+        
+        Instead of N individual tree inserts, the new keys are merged with
+        the existing ones and each tree is rebuilt once from the sorted
+        list. The batch is all-or-nothing: nothing is added if any record
+        is rejected.
+        
+        Args:
+            records: Iterable of (candidate_id, name, overall_score,
+                     domain_scores) tuples, as for add_candidate()
+        
+        Returns:
+            The created CandidateScore objects, in input order
+        
+        Raises:
+            ValueError: If any candidate_id already exists or repeats
+                        within the batch, or the batch would exceed
+                        max_candidates
+        """
+        added: List[CandidateScore] = []
+        seen = set()
+        for candidate_id, name, overall_score, domain_scores in records:
+            if candidate_id in self._candidates or candidate_id in seen:
+                raise ValueError(f"Candidate {candidate_id} already exists")
+            seen.add(candidate_id)
+            added.append(CandidateScore(
+                candidate_id=candidate_id,
+                name=name,
+                score=overall_score,
+                domain_scores=domain_scores,
+                passed=overall_score >= self.passing_threshold
+            ))
+        
+        if not added:
+            return added
+        
+        if len(self._candidates) + len(added) > self.max_candidates:
+            raise ValueError(
+                f"Batch would exceed max_candidates ({self.max_candidates})"
+            )
+        
+        # Merge the new keys into the score tree in one rebuild
+        self._score_tree.bulk_insert(
+            (c.score, c.candidate_id) for c in added
+        )
+        self._score_sum += sum(Fraction(c.score) for c in added)
+        for c in added:
+            self._count_score(c.score, 1)
+        
+        # Same for each domain tree (None scores are skipped, as in
+        # add_candidate())
+        for domain, tree in self._domain_trees.items():
+            new_keys = [
+                (c.domain_scores[domain], c.candidate_id)
+                for c in added if c.domain_scores.get(domain) is not None
+            ]
+            if new_keys:
+                tree.bulk_insert(new_keys)
+                self._domain_sums[domain] += sum(
+                    Fraction(score) for score, _ in new_keys
+                )
+        
+        for candidate in added:
+            self._candidates[candidate.candidate_id] = candidate
+        
+        self._version += 1
+        self._top_k.clear()
+        
+        return added
+    
     def get_candidate(self, candidate_id: str) -> Optional[CandidateScore]:
         """Get a candidate by ID. O(1) operation."""
         return self._candidates.get(candidate_id)
     
+    def _count_score(self, score: float, delta: int) -> None:
+        """Adjust the whole-point histogram for one score (0-100 only)."""
+        if 0 <= score <= 100:
+            self._score_counts[int(score)] += delta
+    
     def remove_candidate(self, candidate_id: str) -> bool:
         """
         Remove a candidate from the tracker.
@@ -210,45 +372,88 @@ class CandidateScoreTracker:
         
         # Remove from score tree
         self._score_tree.delete((candidate.score, candidate_id))
+        self._score_sum -= Fraction(candidate.score)
+        self._count_score(candidate.score, -1)
         
         # Remove from domain trees
-        for domain, score in candidate.domain_scores.items():
-            if domain in self._domain_trees:
-                self._domain_trees[domain].delete((score, candidate_id))
+        domain_scores = candidate.domain_scores
+        for domain, tree in self._domain_trees.items():
+            score = domain_scores.get(domain)
+            if score is not None:
+                tree.delete((score, candidate_id))
+                self._domain_sums[domain] -= Fraction(score)
         
         # Remove from dictionary
         del self._candidates[candidate_id]
         
+        # Bumped before the top-K sweep for the same reason as in
+        # add_candidate()
+        self._version += 1
+        
+        # A top-K list that held this candidate is now short one entry and
+        # can't be refilled without the tree, so drop it
+        key = (candidate.score, candidate_id)
+        for k in [k for k, heap in list(self._top_k.items()) if key in heap]:
+            self._top_k.pop(k, None)
+        
         return True
     
     # =========================================================================
     # RANKING OPERATIONS (Leveraging AVL Tree)
     # =========================================================================
     
+    def _get_ranking(
+        self
+    ) -> Tuple[List[Tuple[float, str]], Dict[str, int], List[float]]:
+        """
+        Get the sorted score array, the candidate -> rank map, and the
+        sorted scores on their own.
+        
+        All three are rebuilt from one AVL traversal the first time they
+        are needed after a mutation, then reused until the version changes.
+        The bare float list lets the statistics use C-level sum() and
+        float-only binary searches instead of Python loops over tuples.
+        
+        Returns:
+            Tuple of (ascending (score, id) list, dict of id -> rank,
+            ascending list of scores)
+        """
+        if self._ranking_version != self._version:
+            # Stamp with the version seen before the traversal, so a write
+            # landing mid-rebuild leaves the cache stale rather than wrong
+            version = self._version
+            keys = self._score_tree.in_order_traversal()
+            n = len(keys)
+            self._ranking = (
+                keys,
+                {cid: n - i for i, (_, cid) in enumerate(keys)},
+                [score for score, _ in keys]
+            )
+            self._ranking_version = version
+        return self._ranking
+    
     def get_rank(self, candidate_id: str) -> Optional[int]:
         """
         Get a candidate's rank (1 = highest score).
         
-        Uses AVL tree's sorted property for efficient ranking.
+        If the cached ranking is current this is an O(1) map lookup.
+        Otherwise the rank is counted in O(log n) from the AVL tree's
+        subtree sizes, so a submit followed by a rank lookup doesn't
+        force a full ranking rebuild.
         
         Returns:
             Rank (1-indexed), or None if candidate not found
         """
-        if candidate_id not in self._candidates:
-            return None
+        if self._ranking_version == self._version:
+            return self._ranking[1].get(candidate_id)
         
-        candidate = self._candidates[candidate_id]
-        
-        # Get all scores in descending order
-        all_scores = self._score_tree.in_order_traversal()
-        all_scores.reverse()  # Highest first
-        
-        # Find position
-        for i, (score, cid) in enumerate(all_scores):
-            if cid == candidate_id:
-                return i + 1  # 1-indexed rank
+        candidate = self._candidates.get(candidate_id)
+        if candidate is None:
+            return None
         
-        return None
+        # Rank 1 is the highest key, i.e. the last in ascending order
+        tree = self._score_tree
+        return len(tree) - tree.rank((candidate.score, candidate_id))
     
     def get_percentile(self, score: float) -> float:
         """
@@ -260,16 +465,49 @@ class CandidateScoreTracker:
         Returns:
             Percentile (0-100), where 100 means top score
         """
-        if self._score_tree.size == 0:
+        if self._ranking_version == self._version:
+            scores = self._ranking[2]
+            n = len(scores)
+            # Count scores strictly below this one
+            below = bisect_left(scores, score) if n else 0
+        else:
+            # Ranking is stale; count in the tree instead of rebuilding.
+            # (score,) sorts before every (score, id) with the same score
+            n = len(self._score_tree)
+            below = self._score_tree.rank((score,)) if n else 0
+        
+        if not n:
             return 0.0
         
-        all_scores = self._score_tree.in_order_traversal()
+        percentile = (below / n) * 100
+        return round(percentile, 1)
+    
+    def get_percentiles(self, scores: Iterable[float]) -> List[float]:
+        """
+        Calculate percentiles for many scores in one pass.
         
-        # Count scores below this one
-        below = sum(1 for s, _ in all_scores if s < score)
+        The queries are visited in ascending order, so each binary search
+        starts where the previous one ended and the whole batch walks the
+        sorted score array once.
         
-        percentile = (below / len(all_scores)) * 100
-        return round(percentile, 1)
+        Args:
+            scores: The scores to evaluate
+        
+        Returns:
+            Percentiles (0-100) in the same order as the input scores
+        """
+        scores = list(scores)
+        ranked = self._get_ranking()[2]
+        if not ranked:
+            return [0.0] * len(scores)
+        
+        n = len(ranked)
+        percentiles = [0.0] * len(scores)
+        below = 0
+        for i in sorted(range(len(scores)), key=scores.__getitem__):
+            below = bisect_left(ranked, scores[i], below)
+            percentiles[i] = round((below / n) * 100, 1)
+        return percentiles
     
     def get_top_candidates(self, n: int = 10) -> List[CandidateScore]:
         """
@@ -281,11 +519,33 @@ class CandidateScoreTracker:
         Returns:
             List of CandidateScore objects, highest scores first
         """
-        all_scores = self._score_tree.in_order_traversal()
-        all_scores.reverse()  # Highest first
-        
-        top_ids = [cid for _, cid in all_scores[:n]]
-        return [self._candidates[cid] for cid in top_ids]
+        if n <= 0:
+            return []
+        
+        version = self._version
+        
+        # Every branch yields the keys highest first, so no extra
+        # reversal pass is needed before the lookup below
+        if self._ranking_version == version:
+            top = self._ranking[0][:-n - 1:-1]
+        elif n in self._top_k:
+            # Ranking is stale; serve from the maintained top-K heap
+            top = sorted(self._top_k[n], reverse=True)
+        else:
+            # Ranking is stale; pull just the n largest keys off the
+            # tree's right edge rather than rebuilding the whole ranking
+            top = self._score_tree.nlargest(n)
+        
+        if n in self.TOP_K_SIZES and n not in self._top_k:
+            # Ascending order is already a valid min-heap. Writers bump the
+            # version before maintaining the heaps, so if none has since
+            # the read, any overlapping write will still see this heap;
+            # otherwise it may have missed a key and is dropped
+            self._top_k[n] = top[::-1]
+            if self._version != version:
+                self._top_k.pop(n, None)
+        
+        return [self._candidates[cid] for _, cid in top]
     
     def get_bottom_candidates(self, n: int = 10) -> List[CandidateScore]:
         """
@@ -297,10 +557,14 @@ class CandidateScoreTracker:
         Returns:
             List of CandidateScore objects, lowest scores first
         """
-        all_scores = self._score_tree.in_order_traversal()
+        if n <= 0:
+            return []
         
-        bottom_ids = [cid for _, cid in all_scores[:n]]
-        return [self._candidates[cid] for cid in bottom_ids]
+        if self._ranking_version == self._version:
+            bottom = self._ranking[0][:n]
+        else:
+            bottom = self._score_tree.nsmallest(n)
+        return [self._candidates[cid] for _, cid in bottom]
     
     # =========================================================================
     # THRESHOLD OPERATIONS
@@ -321,15 +585,13 @@ class CandidateScoreTracker:
         """
         threshold = threshold or self.passing_threshold
         
-        all_scores = self._score_tree.in_order_traversal()
-        
-        passing_ids = [cid for score, cid in all_scores if score >= threshold]
-        candidates = [self._candidates[cid] for cid in passing_ids]
-        
-        # Sort by score descending
-        candidates.sort(key=lambda c: c.score, reverse=True)
+        # The sorted array is split at the threshold with one bisect on
+        # the bare scores; walking the upper part backwards is already
+        # score-descending
+        keys, _, scores = self._get_ranking()
+        split = bisect_left(scores, threshold)
         
-        return candidates
+        return [self._candidates[cid] for _, cid in reversed(keys[split:])]
     
     def get_candidates_below_threshold(
         self,
@@ -346,14 +608,10 @@ class CandidateScoreTracker:
         """
         threshold = threshold or self.passing_threshold
         
-        all_scores = self._score_tree.in_order_traversal()
+        keys, _, scores = self._get_ranking()
+        split = bisect_left(scores, threshold)
         
-        failing_ids = [cid for score, cid in all_scores if score < threshold]
-        candidates = [self._candidates[cid] for cid in failing_ids]
-        
-        candidates.sort(key=lambda c: c.score, reverse=True)
-        
-        return candidates
+        return [self._candidates[cid] for _, cid in reversed(keys[:split])]
     
     def get_candidates_in_range(
         self,
@@ -370,14 +628,13 @@ class CandidateScoreTracker:
         Returns:
             List of candidates in range, sorted by score
         """
-        all_scores = self._score_tree.in_order_traversal()
+        keys, _, scores = self._get_ranking()
         
-        in_range_ids = [
-            cid for score, cid in all_scores
-            if min_score <= score <= max_score
-        ]
+        # The range is one contiguous slice of the sorted array
+        lo = bisect_left(scores, min_score)
+        hi = bisect_right(scores, max_score)
         
-        return [self._candidates[cid] for cid in in_range_ids]
+        return [self._candidates[cid] for _, cid in keys[lo:hi]]
     
     # =========================================================================
     # DOMAIN ANALYSIS
@@ -397,37 +654,61 @@ class CandidateScoreTracker:
             return None
         
         tree = self._domain_trees[domain]
+        n = len(tree)
         
-        if tree.size == 0:
+        if n == 0:
             return None
         
-        all_scores = tree.in_order_traversal()
-        scores_only = [score for score, _ in all_scores]
-        
+        # Nothing here walks the scores: the average comes from the
+        # running sum, min/max are cached by the tree, and the
+        # below-threshold count is a rank query ((threshold,) sorts
+        # before every (threshold, id) key)
         return DomainAnalysis(
             domain=domain,
-            average_score=sum(scores_only) / len(scores_only),
-            min_score=min(scores_only),
-            max_score=max(scores_only),
-            candidates_below_threshold=sum(
-                1 for s in scores_only if s < self.passing_threshold
-            ),
-            total_candidates=len(scores_only)
+            average_score=float(self._domain_sums[domain] / n),
+            min_score=tree.get_min()[0],
+            max_score=tree.get_max()[0],
+            candidates_below_threshold=tree.rank((self.passing_threshold,)),
+            total_candidates=n
         )
     
-    def get_weakest_domain(self) -> Optional[Tuple[str, float]]:
+    def get_domain_analyses(self) -> Dict[str, DomainAnalysis]:
         """
-        Find the domain with the lowest average score.
+        Analyze every domain that has data in a single call.
         
         Returns:
-            Tuple of (domain_name, average_score), or None if no data
+            Dictionary mapping domain name to DomainAnalysis, in DOMAINS
+            order. Domains with no scores are omitted.
         """
-        domain_averages = []
-        
+        analyses = {}
         for domain in self.DOMAINS:
             analysis = self.get_domain_analysis(domain)
             if analysis:
-                domain_averages.append((domain, analysis.average_score))
+                analyses[domain] = analysis
+        return analyses
+    
+    def _domain_averages(self) -> List[Tuple[str, float]]:
+        """
+        (domain, average score) for every domain with data, in DOMAINS
+        order, straight from the running sums (no DomainAnalysis built).
+        """
+        domain_averages = []
+        for domain in self.DOMAINS:
+            n = len(self._domain_trees[domain])
+            if n:
+                domain_averages.append(
+                    (domain, float(self._domain_sums[domain] / n))
+                )
+        return domain_averages
+    
+    def get_weakest_domain(self) -> Optional[Tuple[str, float]]:
+        """
+        Find the domain with the lowest average score.
+        
+        Returns:
+            Tuple of (domain_name, average_score), or None if no data
+        """
+        domain_averages = self._domain_averages()
         
         if not domain_averages:
             return None
@@ -441,12 +722,7 @@ class CandidateScoreTracker:
         Returns:
             Tuple of (domain_name, average_score), or None if no data
         """
-        domain_averages = []
-        
-        for domain in self.DOMAINS:
-            analysis = self.get_domain_analysis(domain)
-            if analysis:
-                domain_averages.append((domain, analysis.average_score))
+        domain_averages = self._domain_averages()
         
         if not domain_averages:
             return None
@@ -472,22 +748,27 @@ class CandidateScoreTracker:
                 "pass_rate": 0.0
             }
         
-        all_scores = self._score_tree.in_order_traversal()
-        scores_only = [score for score, _ in all_scores]
+        # All O(log n) or better, without walking the scores: the average
+        # comes from the running sum, the passing count and median from
+        # the tree's rank/select, and min/max are cached by the tree
+        tree = self._score_tree
+        n = len(tree)
         
-        passing = sum(1 for s in scores_only if s >= self.passing_threshold)
-        failing = len(scores_only) - passing
+        passing = n - tree.rank((self.passing_threshold,))
+        failing = n - passing
+        min_score = tree.get_min()[0]
+        max_score = tree.get_max()[0]
         
         return {
-            "total_candidates": len(scores_only),
+            "total_candidates": n,
             "passing_candidates": passing,
             "failing_candidates": failing,
-            "pass_rate": round((passing / len(scores_only)) * 100, 1),
-            "average_score": round(sum(scores_only) / len(scores_only), 1),
-            "median_score": round(scores_only[len(scores_only) // 2], 1),
-            "min_score": round(min(scores_only), 1),
-            "max_score": round(max(scores_only), 1),
-            "score_range": round(max(scores_only) - min(scores_only), 1),
+            "pass_rate": round((passing / n) * 100, 1),
+            "average_score": round(float(self._score_sum / n), 1),
+            "median_score": round(tree.select(n // 2)[0], 1),
+            "min_score": round(min_score, 1),
+            "max_score": round(max_score, 1),
+            "score_range": round(max_score - min_score, 1),
             "passing_threshold": self.passing_threshold
         }
     
@@ -501,19 +782,19 @@ class CandidateScoreTracker:
         Returns:
             Dictionary mapping bucket labels to counts
         """
-        all_scores = self._score_tree.in_order_traversal()
-        scores_only = [score for score, _ in all_scores]
+        counts = self._score_counts
         
         distribution = {}
         
+        # Each bucket is a run of whole-point counters (a score of 9.5
+        # lands in 0-9). Only the "100" bucket holds a perfect score.
         for start in range(0, 100, bucket_size):
             end = start + bucket_size - 1
             label = f"{start}-{end}"
-            count = sum(1 for s in scores_only if start <= s <= end)
-            distribution[label] = count
+            distribution[label] = sum(counts[start:min(end + 1, 100)])
         
         # Handle 100 separately
-        distribution["100"] = sum(1 for s in scores_only if s == 100)
+        distribution["100"] = counts[100]
         
         return distribution
     
@@ -525,9 +806,18 @@ class CandidateScoreTracker:
         """
         Generate a comprehensive text report of assessment results.
         
+        The rendered text is kept and returned as-is until a candidate is
+        added or removed (or the passing threshold changes), so repeated
+        requests between submits cost a tuple comparison. Its "Generated"
+        line is the time it was actually rendered.
+        
         Returns:
             Formatted report string
         """
+        key = (self._version, self.passing_threshold)
+        if self._report_key == key:
+            return self._report
+        
         stats = self.get_statistics()
         
         report = []
@@ -560,20 +850,23 @@ class CandidateScoreTracker:
             # Domain Analysis
             report.append("DOMAIN ANALYSIS")
             report.append("-" * 40)
-            for domain in self.DOMAINS:
-                analysis = self.get_domain_analysis(domain)
-                if analysis:
-                    report.append(
-                        f"{domain.capitalize():.<20} "
-                        f"Avg: {analysis.average_score:.1f}%  "
-                        f"(Min: {analysis.min_score:.1f}, Max: {analysis.max_score:.1f})"
-                    )
+            analyses = self.get_domain_analyses()
+            for domain, analysis in analyses.items():
+                report.append(
+                    f"{domain.capitalize():.<20} "
+                    f"Avg: {analysis.average_score:.1f}%  "
+                    f"(Min: {analysis.min_score:.1f}, Max: {analysis.max_score:.1f})"
+                )
             report.append("")
             
-            # Weakest/Strongest
-            weakest = self.get_weakest_domain()
-            strongest = self.get_strongest_domain()
-            if weakest and strongest:
+            # Weakest/Strongest, from the analyses already built above
+            domain_averages = [
+                (domain, analysis.average_score)
+                for domain, analysis in analyses.items()
+            ]
+            if domain_averages:
+                weakest = min(domain_averages, key=lambda x: x[1])
+                strongest = max(domain_averages, key=lambda x: x[1])
                 report.append(f"Strongest Domain:     {strongest[0].capitalize()} ({strongest[1]:.1f}%)")
                 report.append(f"Weakest Domain:       {weakest[0].capitalize()} ({weakest[1]:.1f}%)")
                 report.append("")
@@ -598,12 +891,19 @@ class CandidateScoreTracker:
         report.append("")
         report.append("=" * 60)
         
-        return "\n".join(report)
+        self._report = "\n".join(report)
+        self._report_key = key
+        return self._report
     
     # =========================================================================
     # PROPERTIES
     # =========================================================================
     
+    @property
+    def version(self) -> int:
+        """Get the mutation counter (changes whenever candidates change)."""
+        return self._version
+    
     @property
     def total_candidates(self) -> int:
         """Get total number of candidates."""
@@ -612,12 +912,13 @@ class CandidateScoreTracker:
     @property
     def passing_count(self) -> int:
         """Get number of passing candidates."""
-        return sum(1 for c in self._candidates.values() if c.passed)
+        tree = self._score_tree
+        return len(tree) - tree.rank((self.passing_threshold,))
     
     @property
     def failing_count(self) -> int:
         """Get number of failing candidates."""
-        return sum(1 for c in self._candidates.values() if not c.passed)
+        return self._score_tree.rank((self.passing_threshold,))
 
 
 # =============================================================================
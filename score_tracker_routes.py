@@ -22,11 +22,18 @@ Example:
     app.register_blueprint(score_tracker_bp, url_prefix='/scores')
 """
 
-from flask import Blueprint, request, jsonify, render_template_string
+from flask import (
+    Blueprint, current_app, request, jsonify, make_response,
+    render_template
+)
 from functools import wraps
 from datetime import datetime
+import atexit
+import gzip
 import json
 import os
+import threading
+import uuid
 
 # Import our AVL-based tracker
 from candidate_score_tracker import CandidateScoreTracker, CandidateScore
@@ -40,6 +47,13 @@ score_tracker_bp = Blueprint('score_tracker', __name__)
 # Global tracker instance (initialized by init_tracker)
 _tracker: CandidateScoreTracker = None
 
+# Bumped whenever _tracker is replaced; its version restarts at 0, so
+# cached responses are keyed on both (see cached_view)
+_tracker_generation = 0
+
+# Random per-process token for ETags; generations restart on every boot
+_BOOT_ID = uuid.uuid4().hex[:8]
+
 
 def init_tracker(app, passing_threshold=70.0, max_candidates=10000):
     """
@@ -53,30 +67,35 @@ def init_tracker(app, passing_threshold=70.0, max_candidates=10000):
         passing_threshold: Minimum passing score (default 70%)
         max_candidates: Maximum candidates to track
     """
-    global _tracker
+    global _tracker, _tracker_generation
     _tracker = CandidateScoreTracker(
         passing_threshold=passing_threshold,
         max_candidates=max_candidates
     )
+    _tracker_generation += 1
     
     # Store config in app
     app.config['SCORE_TRACKER_THRESHOLD'] = passing_threshold
     app.config['SCORE_TRACKER_MAX'] = max_candidates
     
+    # Skip the per-response key sort in Flask's JSON provider; clients
+    # read fields by name, so ordering buys nothing on the score routes
+    app.json.sort_keys = False
+    
     # Try to load existing data if available
     data_file = app.config.get('SCORE_DATA_FILE', 'score_data.json')
-    if os.path.exists(data_file):
-        load_tracker_data(data_file)
+    load_tracker_data(data_file)
     
     return _tracker
 
 
 def get_tracker() -> CandidateScoreTracker:
     """Get the global tracker instance."""
-    global _tracker
+    global _tracker, _tracker_generation
     if _tracker is None:
         # Create default tracker if not initialized
         _tracker = CandidateScoreTracker()
+        _tracker_generation += 1
     return _tracker
 
 
@@ -93,78 +112,305 @@ def require_tracker(f):
     return decorated
 
 
+# Rendered bodies of read-only endpoints, valid for _view_cache_state
+_view_cache = {}
+_view_cache_state = None
+
+# Distinct URLs (path + query string) kept per tracker state
+_VIEW_CACHE_LIMIT = 256
+
+
+def cached_view(f):
+    """
+    Decorator to reuse a read-only endpoint's response body until the
+    tracker changes.
+    
+    Bodies are keyed on the full URL (so query parameters such as
+    ?limit= or ?bucket_size= get their own entry) and are only valid for
+    one tracker generation and version. Every add/remove bumps the
+    version, so nothing needs to be invalidated by the write routes; the
+    first request after a change simply drops the old entries.
+    Only 200 responses are cached.
+    
+    Responses also carry an ETag for that state, so a polling client that
+    sends If-None-Match gets a bodyless 304 until something changes. The
+    tag also carries a per-process boot token, as in versioned(), so tags
+    from before a restart don't match. It is weak because the same state may be sent gzipped or not (see
+    compress_response).
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        global _view_cache, _view_cache_state
+        
+        state = (_tracker_generation, get_tracker().version)
+        etag = f"{_BOOT_ID}-{state[0]}-{state[1]}"
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        
+        # Bind the dict for this state now: another request may swap in a
+        # newer one while f() runs, and this body must not land there
+        cache = _view_cache
+        if state != _view_cache_state or len(cache) >= _VIEW_CACHE_LIMIT:
+            cache = _view_cache = {}
+            _view_cache_state = state
+        
+        key = request.full_path
+        cached = cache.get(key)
+        if cached is None:
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            cached = (response.get_data(), response.mimetype)
+            # A write during f() may or may not be in the body, so only
+            # keep it if the state it is tagged with still holds
+            if (_tracker_generation, get_tracker().version) == state:
+                cache[key] = cached
+        
+        body, mimetype = cached
+        response = current_app.response_class(body, mimetype=mimetype)
+        response.set_etag(etag, weak=True)
+        return response
+    return decorated
+
+
+# Responses worth compressing: text formats of at least this many bytes
+# (below ~1 KB the gzip header and CPU outweigh the saving)
+COMPRESS_MIMETYPES = {'application/json', 'text/html', 'text/plain'}
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 4
+
+
+@score_tracker_bp.after_request
+def compress_response(response):
+    """
+    Gzip score-route responses when the client accepts it.
+    
+    Rankings, reports and the dashboard are repetitive text (the same JSON
+    keys or HTML on every row), so they typically shrink by 70-85%.
+    Level 4 keeps the CPU cost low; Brotli would need an extra package.
+    """
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+        or 'gzip' not in request.accept_encodings
+    ):
+        return response
+    
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL, mtime=0))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 # =============================================================================
 # DATA PERSISTENCE
 # =============================================================================
 
+# Changes made since the last snapshot are appended to a log next to it
+# (score_data.json -> score_data.log), one JSON record per line, and
+# replayed on load. The snapshot is rewritten after this many appends.
+COMPACT_EVERY = 1000
+
+# Number of records currently sitting in the log
+_log_appends = 0
+
+# The dev server (and any threaded WSGI server) handles requests on
+# several threads. Tracker mutations and the log/snapshot files they feed
+# must not interleave, so writers serialize on this lock.
+_write_lock = threading.Lock()
+
+
+def _log_path(filepath):
+    """Path of the append log that belongs to a snapshot file."""
+    return os.path.splitext(filepath)[0] + '.log'
+
+
+def _candidate_record(candidate):
+    """Serializable dict for one candidate (snapshot and log format)."""
+    return {
+        "candidate_id": candidate.candidate_id,
+        "name": candidate.name,
+        "score": candidate.score,
+        "domain_scores": candidate.domain_scores,
+        "timestamp": candidate.timestamp_iso,
+        "passed": candidate.passed
+    }
+
+
 def save_tracker_data(filepath='score_data.json'):
     """
-    Save tracker data to JSON file for persistence.
+    Save a full snapshot of tracker data to JSON file.
     
-    Call this after adding candidates or periodically.
+    This is the compaction step: once the snapshot is on disk the
+    append log is redundant and gets removed. Routes call
+    append_tracker_log() instead; call this to force a snapshot.
     """
+    global _log_appends
+    
     tracker = get_tracker()
     
     data = {
         "saved_at": datetime.now().isoformat(),
         "passing_threshold": tracker.passing_threshold,
-        "candidates": []
+        "candidates": [
+            _candidate_record(c) for c in tracker._candidates.values()
+        ]
     }
     
-    for cid, candidate in tracker._candidates.items():
-        data["candidates"].append({
-            "candidate_id": candidate.candidate_id,
-            "name": candidate.name,
-            "score": candidate.score,
-            "domain_scores": candidate.domain_scores,
-            "timestamp": candidate.timestamp.isoformat(),
-            "passed": candidate.passed
-        })
-    
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Compact separators: no indent/whitespace keeps the encoder on its
+    # fast path and roughly halves the bytes written. The file stays
+    # plain JSON, so existing saves load unchanged.
+    # Write to a temp file and swap it in so a crash mid-write never
+    # leaves a truncated snapshot behind.
+    tmp_file = filepath + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_file, filepath)
+    
+    log_file = _log_path(filepath)
+    if os.path.exists(log_file):
+        os.remove(log_file)
+    _log_appends = 0
     
     return len(data["candidates"])
 
 
+def append_tracker_log(record, filepath='score_data.json'):
+    """
+    Persist one change by appending it to the log.
+    
+    O(1) per change instead of rewriting every candidate; the snapshot
+    is rebuilt every COMPACT_EVERY appends and on shutdown.
+    
+    Args:
+        record: A candidate record (see _candidate_record), or
+                {"candidate_id": ..., "deleted": True} for a removal
+        filepath: Snapshot file the log belongs to
+    """
+    global _log_appends
+    
+    line = json.dumps(record, separators=(',', ':'))
+    with open(_log_path(filepath), 'a') as f:
+        f.write(line + "\n")
+    
+    _log_appends += 1
+    if _log_appends >= COMPACT_EVERY:
+        save_tracker_data(filepath)
+
+
+@atexit.register
+def _compact_on_exit():
+    """Fold any pending log records into the snapshot on shutdown."""
+    with _write_lock:
+        if _log_appends and _tracker is not None:
+            save_tracker_data()
+
+
 def load_tracker_data(filepath='score_data.json'):
     """
-    Load tracker data from JSON file.
+    Load tracker data from the JSON snapshot, then replay its log.
     
-    Called automatically by init_tracker if file exists.
+    Called automatically by init_tracker if either file exists.
+    
+    Returns:
+        Number of candidates loaded
     """
-    global _tracker
+    global _tracker, _tracker_generation, _log_appends
     
-    if not os.path.exists(filepath):
+    log_file = _log_path(filepath)
+    if not os.path.exists(filepath) and not os.path.exists(log_file):
         return 0
     
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    data = {}
+    if os.path.exists(filepath):
+        with open(filepath, 'r') as f:
+            data = json.load(f)
     
     # Recreate tracker with saved threshold
     threshold = data.get("passing_threshold", 70.0)
     _tracker = CandidateScoreTracker(passing_threshold=threshold)
+    _tracker_generation += 1
     
-    # Add all candidates
+    # Collect all candidates first (skipping duplicate IDs, first one
+    # wins) so the trees are built in one bulk load instead of N inserts
+    records = {}
     for c in data.get("candidates", []):
-        try:
-            _tracker.add_candidate(
-                candidate_id=c["candidate_id"],
-                name=c["name"],
-                overall_score=c["score"],
-                domain_scores=c["domain_scores"]
-            )
-        except ValueError:
-            # Skip duplicates
-            pass
-    
-    return len(data.get("candidates", []))
+        records.setdefault(c["candidate_id"], (
+            c["candidate_id"], c["name"], c["score"], c["domain_scores"]
+        ))
+    
+    # Replay changes logged after the snapshot on top; later records win
+    _log_appends = 0
+    if os.path.exists(log_file):
+        with open(log_file, 'r') as f:
+            for line in f:
+                try:
+                    c = json.loads(line)
+                except ValueError:
+                    continue  # Torn final line from an interrupted write
+                records.pop(c["candidate_id"], None)
+                if not c.get("deleted"):
+                    records[c["candidate_id"]] = (
+                        c["candidate_id"], c["name"], c["score"],
+                        c["domain_scores"]
+                    )
+                _log_appends += 1
+    
+    _tracker.bulk_add(records.values())
+    
+    return _tracker.total_candidates
 
 
 # =============================================================================
 # API ROUTES - CANDIDATE MANAGEMENT
 # =============================================================================
 
+# Fields every /submit body (and every /submit_batch entry) must have
+SUBMIT_FIELDS = ('candidate_id', 'name', 'overall_score', 'domain_scores')
+
+
+def parse_submission(data):
+    """
+    Validate and coerce one submission body in a single pass.
+    
+    Runs before the write lock is taken, so parsing never holds up other
+    writers and a bad entry never touches the tracker.
+    
+    Returns:
+        Tuple of (candidate_id, name, overall_score, domain_scores) with
+        the scores as floats, ready for add_candidate()/bulk_add().
+    
+    Raises:
+        ValueError: With a message suitable for the 400 response.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    
+    missing = [f for f in SUBMIT_FIELDS if f not in data]
+    if missing:
+        raise ValueError(f"Missing required fields: {missing}")
+    
+    domain_scores = data['domain_scores']
+    if not isinstance(domain_scores, dict):
+        raise ValueError("domain_scores must be an object")
+    
+    try:
+        overall_score = float(data['overall_score'])
+        domain_scores = {k: float(v) for k, v in domain_scores.items()}
+    except (TypeError, ValueError):
+        raise ValueError("Scores must be numeric")
+    
+    return data['candidate_id'], data['name'], overall_score, domain_scores
+
+
 @score_tracker_bp.route('/submit', methods=['POST'])
 @require_tracker
 def submit_score():
@@ -195,28 +441,24 @@ def submit_score():
     if not data:
         return jsonify({"error": "No JSON data provided"}), 400
     
-    required_fields = ['candidate_id', 'name', 'overall_score', 'domain_scores']
-    missing = [f for f in required_fields if f not in data]
-    if missing:
-        return jsonify({
-            "error": f"Missing required fields: {missing}"
-        }), 400
-    
     tracker = get_tracker()
     
     try:
-        candidate = tracker.add_candidate(
-            candidate_id=data['candidate_id'],
-            name=data['name'],
-            overall_score=float(data['overall_score']),
-            domain_scores={k: float(v) for k, v in data['domain_scores'].items()}
-        )
+        candidate_id, name, overall_score, domain_scores = parse_submission(data)
         
-        # Auto-save after adding
-        save_tracker_data()
+        with _write_lock:
+            candidate = tracker.add_candidate(
+                candidate_id=candidate_id,
+                name=name,
+                overall_score=overall_score,
+                domain_scores=domain_scores
+            )
+            
+            # Auto-save after adding
+            append_tracker_log(_candidate_record(candidate))
         
         # Get additional info
-        rank = tracker.get_rank(data['candidate_id'])
+        rank = tracker.get_rank(candidate_id)
         percentile = tracker.get_percentile(candidate.score)
         
         return jsonify({
@@ -237,6 +479,76 @@ def submit_score():
         return jsonify({"error": str(e)}), 400
 
 
+@score_tracker_bp.route('/submit_batch', methods=['POST'])
+@require_tracker
+def submit_batch():
+    """
+    Submit many candidates' assessment scores at once.
+    
+    POST /scores/submit_batch
+    Body (JSON):
+        {
+            "candidates": [
+                {"candidate_id": "C001", "name": ..., "overall_score": ...,
+                 "domain_scores": {...}},
+                ...
+            ]
+        }
+    
+    The batch is all-or-nothing: every entry is validated first, the
+    trees are built in one bulk insert, the data is saved once, and the
+    ranks/percentiles for the whole batch come from one ranking pass.
+    
+    Returns:
+        The added candidates with rank and percentile, in input order
+    """
+    data = request.get_json()
+    
+    if not isinstance(data, dict) or not isinstance(data.get('candidates'), list):
+        return jsonify({
+            "error": "Expected a JSON object with a 'candidates' list"
+        }), 400
+    
+    records = []
+    for i, entry in enumerate(data['candidates']):
+        try:
+            records.append(parse_submission(entry))
+        except ValueError as e:
+            return jsonify({"error": f"candidates[{i}]: {e}"}), 400
+    
+    tracker = get_tracker()
+    
+    try:
+        with _write_lock:
+            added = tracker.bulk_add(records)
+            
+            # One snapshot write for the whole batch instead of N log appends
+            if added:
+                save_tracker_data()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # The first get_rank rebuilds the ranking once; the rest are lookups
+    percentiles = tracker.get_percentiles(c.score for c in added)
+    
+    return jsonify({
+        "success": True,
+        "submitted": len(added),
+        "total_candidates": tracker.total_candidates,
+        "candidates": [
+            {
+                "id": c.candidate_id,
+                "name": c.name,
+                "score": round(c.score, 1),
+                "passed": c.passed,
+                "rank": tracker.get_rank(c.candidate_id),
+                "percentile": round(percentile, 1)
+            }
+            for c, percentile in zip(added, percentiles)
+        ]
+    }), 201
+
+
 @score_tracker_bp.route('/candidate/<candidate_id>', methods=['GET'])
 @require_tracker
 def get_candidate(candidate_id):
@@ -264,7 +576,7 @@ def get_candidate(candidate_id):
             "total_candidates": tracker.total_candidates,
             "percentile": round(percentile, 1),
             "domain_scores": {k: round(v, 1) for k, v in candidate.domain_scores.items()},
-            "timestamp": candidate.timestamp.isoformat()
+            "timestamp": candidate.timestamp_iso
         }
     })
 
@@ -279,8 +591,12 @@ def delete_candidate(candidate_id):
     """
     tracker = get_tracker()
     
-    if tracker.remove_candidate(candidate_id):
-        save_tracker_data()
+    with _write_lock:
+        removed = tracker.remove_candidate(candidate_id)
+        if removed:
+            append_tracker_log({"candidate_id": candidate_id, "deleted": True})
+    
+    if removed:
         return jsonify({
             "success": True,
             "message": f"Candidate {candidate_id} removed"
@@ -293,8 +609,30 @@ def delete_candidate(candidate_id):
 # API ROUTES - RANKINGS & ANALYSIS
 # =============================================================================
 
+def _ranking_rows_json(candidates, first_rank=1):
+    """
+    Encode ranked candidates as a JSON array of
+    {rank, candidate_id, name, score, passed} rows.
+    
+    Rows are templated directly rather than built as dicts for jsonify:
+    only the strings need escaping, and '.1f' writes the one-decimal
+    score as a JSON number in a single format call instead of round()
+    followed by repr().
+    """
+    dumps = json.dumps
+    return "[" + ",".join(
+        f'{{"rank":{rank},'
+        f'"candidate_id":{dumps(c.candidate_id)},'
+        f'"name":{dumps(c.name)},'
+        f'"score":{c.score:.1f},'
+        f'"passed":{"true" if c.passed else "false"}}}'
+        for rank, c in enumerate(candidates, first_rank)
+    ) + "]"
+
+
 @score_tracker_bp.route('/rankings', methods=['GET'])
 @require_tracker
+@cached_view
 def get_rankings():
     """
     Get candidate rankings.
@@ -310,33 +648,30 @@ def get_rankings():
     limit = request.args.get('limit', 10, type=int)
     filter_type = request.args.get('filter', 'all')
     
+    # Each list is a contiguous, score-descending run of the overall
+    # ranking, so ranks follow from the position: the top and passing
+    # lists start at rank 1, the failing list right after the rest
+    first_rank = 1
     if filter_type == 'passed':
         candidates = tracker.get_candidates_above_threshold()[:limit]
     elif filter_type == 'failed':
-        candidates = tracker.get_candidates_below_threshold()[:limit]
+        failing = tracker.get_candidates_below_threshold()
+        first_rank = tracker.total_candidates - len(failing) + 1
+        candidates = failing[:limit]
     else:
         candidates = tracker.get_top_candidates(limit)
     
-    rankings = []
-    for i, c in enumerate(candidates, 1):
-        rank = tracker.get_rank(c.candidate_id)
-        rankings.append({
-            "rank": rank,
-            "candidate_id": c.candidate_id,
-            "name": c.name,
-            "score": round(c.score, 1),
-            "passed": c.passed
-        })
-    
-    return jsonify({
-        "total_candidates": tracker.total_candidates,
-        "filter": filter_type,
-        "rankings": rankings
-    })
+    body = (
+        f'{{"total_candidates":{tracker.total_candidates},'
+        f'"filter":{json.dumps(filter_type)},'
+        f'"rankings":{_ranking_rows_json(candidates, first_rank)}}}'
+    )
+    return current_app.response_class(body, mimetype='application/json')
 
 
 @score_tracker_bp.route('/top/<int:n>', methods=['GET'])
 @require_tracker
+@cached_view
 def get_top_n(n):
     """
     Get top N candidates.
@@ -346,18 +681,8 @@ def get_top_n(n):
     tracker = get_tracker()
     candidates = tracker.get_top_candidates(n)
     
-    return jsonify({
-        "top_candidates": [
-            {
-                "rank": i,
-                "candidate_id": c.candidate_id,
-                "name": c.name,
-                "score": round(c.score, 1),
-                "passed": c.passed
-            }
-            for i, c in enumerate(candidates, 1)
-        ]
-    })
+    body = f'{{"top_candidates":{_ranking_rows_json(candidates)}}}'
+    return current_app.response_class(body, mimetype='application/json')
 
 
 @score_tracker_bp.route('/percentile/<float:score>', methods=['GET'])
@@ -384,6 +709,7 @@ def get_percentile_for_score(score):
 
 @score_tracker_bp.route('/statistics', methods=['GET'])
 @require_tracker
+@cached_view
 def get_statistics():
     """
     Get comprehensive statistics.
@@ -398,6 +724,7 @@ def get_statistics():
 
 @score_tracker_bp.route('/domain-analysis', methods=['GET'])
 @require_tracker
+@cached_view
 def get_domain_analysis():
     """
     Get analysis for all domains.
@@ -406,36 +733,41 @@ def get_domain_analysis():
     """
     tracker = get_tracker()
     
+    # One analysis per domain (each O(log n) off the domain trees and
+    # running sums), reused for weakest/strongest below
+    domain_analyses = tracker.get_domain_analyses()
+    
     analyses = {}
-    for domain in tracker.DOMAINS:
-        analysis = tracker.get_domain_analysis(domain)
-        if analysis:
-            analyses[domain] = {
-                "average_score": round(analysis.average_score, 1),
-                "min_score": round(analysis.min_score, 1),
-                "max_score": round(analysis.max_score, 1),
-                "candidates_below_threshold": analysis.candidates_below_threshold,
-                "total_candidates": analysis.total_candidates
-            }
+    for domain, analysis in domain_analyses.items():
+        analyses[domain] = {
+            "average_score": round(analysis.average_score, 1),
+            "min_score": round(analysis.min_score, 1),
+            "max_score": round(analysis.max_score, 1),
+            "candidates_below_threshold": analysis.candidates_below_threshold,
+            "total_candidates": analysis.total_candidates
+        }
     
-    weakest = tracker.get_weakest_domain()
-    strongest = tracker.get_strongest_domain()
+    weakest = strongest = None
+    if domain_analyses:
+        weakest = min(domain_analyses.values(), key=lambda a: a.average_score)
+        strongest = max(domain_analyses.values(), key=lambda a: a.average_score)
     
     return jsonify({
         "domains": analyses,
         "weakest_domain": {
-            "name": weakest[0] if weakest else None,
-            "average": round(weakest[1], 1) if weakest else None
+            "name": weakest.domain if weakest else None,
+            "average": round(weakest.average_score, 1) if weakest else None
         },
         "strongest_domain": {
-            "name": strongest[0] if strongest else None,
-            "average": round(strongest[1], 1) if strongest else None
+            "name": strongest.domain if strongest else None,
+            "average": round(strongest.average_score, 1) if strongest else None
         }
     })
 
 
 @score_tracker_bp.route('/distribution', methods=['GET'])
 @require_tracker
+@cached_view
 def get_distribution():
     """
     Get score distribution.
@@ -599,6 +931,7 @@ DASHBOARD_TEMPLATE = """
 
 @score_tracker_bp.route('/dashboard', methods=['GET'])
 @require_tracker
+@cached_view
 def dashboard():
     """
     Render HTML dashboard.
@@ -619,8 +952,15 @@ def dashboard():
     
     top_candidates = tracker.get_top_candidates(10)
     
-    return render_template_string(
-        DASHBOARD_TEMPLATE,
+    # render_template_string() would re-lex and re-compile the template on
+    # every call; compile it once per app and render the cached Template
+    template = current_app.extensions.get('score_tracker_dashboard')
+    if template is None:
+        template = current_app.jinja_env.from_string(DASHBOARD_TEMPLATE)
+        current_app.extensions['score_tracker_dashboard'] = template
+    
+    return render_template(
+        template,
         stats=stats,
         domains=domains,
         top_candidates=top_candidates
@@ -684,4 +1024,6 @@ if __name__ == "__main__":
     print("=" * 50)
     print()
     
-    app.run(debug=True, port=5000)
+    # Reloader/debugger only when asked for (FLASK_DEBUG=1)
+    debug = os.getenv('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, port=5000, threaded=True, use_reloader=debug)